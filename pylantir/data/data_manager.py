@@ -1,6 +1,10 @@
 import json
+import logging
 from typing import List, Dict, Optional, Any, Union
 from pylantir.data.map_manager import MapManager
+from pylantir.data.json_io import read_json
+
+logger = logging.getLogger(__name__)
 
 class DataManager:
     def __init__(self, map_manager: MapManager):
@@ -31,44 +35,54 @@ class DataManager:
             self.report_data = None
 
             # Load and parse the JSON file
-            with open(filename, 'r', encoding='utf-8') as f:
-                self.report_data = json.load(f)
-
-            print(f"Report loaded successfully from {filename}")
-            print(f"Number of regions in report: {len(self.report_data.get('regions', []))}")
-            
-            # After successfully loading the report, update the MapManager
-            self.update_map_manager()
+            report_data = read_json(filename)
+            logger.debug("Report loaded from %s", filename)
+
+            self.apply_report(report_data)
         except FileNotFoundError:
-            print(f"Error: File '{filename}' not found.")
+            logger.error("File '%s' not found.", filename)
             raise
         except json.JSONDecodeError as e:
-            print(f"Error decoding JSON in '{filename}': {str(e)}")
+            logger.error("Error decoding JSON in '%s': %s", filename, e)
             raise
         except PermissionError:
-            print(f"Error: Permission denied when trying to read '{filename}'.")
+            logger.error("Permission denied when trying to read '%s'.", filename)
             raise
         except Exception as e:
-            print(f"An unexpected error occurred while loading the report: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("An unexpected error occurred while loading the report: %s", e)
             raise
 
+    def apply_report(self, report_data: Dict) -> None:
+        """
+        Make an already parsed report the current one and update the MapManager.
+
+        This is the part of load_report that must run on the GUI thread; the
+        file read and JSON parse can happen elsewhere.
+
+        Args:
+            report_data (Dict): The parsed JSON report.
+
+        Returns:
+            None
+        """
+        self.report_data = report_data
+
+        # After successfully loading the report, update the MapManager
+        self.update_map_manager()
+
     def update_map_manager(self) -> None:
         if self.report_data is None:
-            print("No report data loaded. Please load a report first.")
+            logger.warning("No report data loaded. Please load a report first.")
             return
 
         regions = self.report_data.get('regions', [])
-        print(f"Updating MapManager with {len(regions)} regions")
+        logger.debug("Updating MapManager with %d regions", len(regions))
         for region in regions:
             coordinates = region.get('coordinates', {})
             x, y = coordinates.get('x'), coordinates.get('y')
             if x is not None and y is not None:
                 self.map_manager.update_region(x, y, region)
 
-        print("MapManager updated with the latest report data.")
-
    
     def get_regions(self) -> List[Dict]:
         """
@@ -83,20 +97,20 @@ class DataManager:
         """
         try:
             if self.report_data is None:
-                print("No report data loaded. Please load a report first.")
+                logger.warning("No report data loaded. Please load a report first.")
                 return []
 
             regions = self.report_data.get('regions', [])
             if not regions:
-                print("No region data found in the loaded report.")
+                logger.debug("No region data found in the loaded report.")
 
             return regions
 
         except AttributeError as e:
-            print(f"Error accessing region data: {e}")
+            logger.error("Error accessing region data: %s", e)
             return []
         except Exception as e:
-            print(f"An unexpected error occurred while getting regions: {e}")
+            logger.error("An unexpected error occurred while getting regions: %s", e)
             return []
 
     def get_faction_info(self) -> Dict[str, str]:
@@ -113,7 +127,7 @@ class DataManager:
         """
         try:
             if self.report_data is None:
-                print("No report data loaded. Please load a report first.")
+                logger.warning("No report data loaded. Please load a report first.")
                 return {"name": "Unknown", "number": "Unknown"}
 
             faction_info = {
@@ -124,10 +138,10 @@ class DataManager:
             return faction_info
 
         except AttributeError as e:
-            print(f"Error accessing faction data: {e}")
+            logger.error("Error accessing faction data: %s", e)
             return {"name": "Unknown", "number": "Unknown"}
         except Exception as e:
-            print(f"An unexpected error occurred while getting faction info: {e}")
+            logger.error("An unexpected error occurred while getting faction info: %s", e)
             return {"name": "Unknown", "number": "Unknown"}
 
     def save_persistent_data(self, map_manager: MapManager) -> None:
@@ -142,7 +156,7 @@ class DataManager:
         """
         try:
             if self.report_data is None:
-                print("No report data loaded. Please load a report first.")
+                logger.warning("No report data loaded. Please load a report first.")
                 return
 
             regions = self.report_data.get('regions', [])
@@ -162,12 +176,12 @@ class DataManager:
                     }
 
             map_manager.update_map_data(persistent_data)
-            print("Persistent data saved to MapManager successfully.")
+            logger.debug("Persistent data saved to MapManager successfully.")
 
         except AttributeError as e:
-            print(f"Error accessing report data: {e}")
+            logger.error("Error accessing report data: %s", e)
         except Exception as e:
-            print(f"An unexpected error occurred while saving persistent data: {e}")
+            logger.error("An unexpected error occurred while saving persistent data: %s", e)
 
     def get_date_info(self) -> Dict[str, str]:
         """
@@ -183,7 +197,7 @@ class DataManager:
         """
         try:
             if self.report_data is None:
-                print("No report data loaded. Please load a report first.")
+                logger.warning("No report data loaded. Please load a report first.")
                 return {"month": "Unknown", "year": "Unknown"}
 
             date_info = self.report_data.get("date", {})
@@ -193,10 +207,10 @@ class DataManager:
             }
 
         except AttributeError as e:
-            print(f"Error accessing date information: {e}")
+            logger.error("Error accessing date information: %s", e)
             return {"month": "Unknown", "year": "Unknown"}
         except Exception as e:
-            print(f"An unexpected error occurred while getting date info: {e}")
+            logger.error("An unexpected error occurred while getting date info: %s", e)
             return {"month": "Unknown", "year": "Unknown"}
 
     def get_all_events_for_hex(self, x: int, y: int) -> List[Dict[str, Any]]:
@@ -216,7 +230,7 @@ class DataManager:
         """
         try:
             if self.report_data is None:
-                print("No report data loaded. Please load a report first.")
+                logger.warning("No report data loaded. Please load a report first.")
                 return []
 
             all_events = self.report_data.get('events', [])
@@ -249,10 +263,10 @@ class DataManager:
             return unique_events
 
         except AttributeError as e:
-            print(f"Error accessing report data: {e}")
+            logger.error("Error accessing report data: %s", e)
             return []
         except Exception as e:
-            print(f"An unexpected error occurred while getting events for hex ({x}, {y}): {e}")
+            logger.error("An unexpected error occurred while getting events for hex (%s, %s): %s", x, y, e)
             return []
 
     def get_orders_for_hex(self, x: int, y: int) -> List[Dict[str, Any]]:
@@ -268,7 +282,7 @@ class DataManager:
         """
         try:
             if self.report_data is None:
-                print("No report data loaded. Please load a report first.")
+                logger.warning("No report data loaded. Please load a report first.")
                 return []
 
             regions = self.report_data.get('regions', [])
@@ -277,7 +291,7 @@ class DataManager:
                                   and region.get('coordinates', {}).get('y') == y), None)
 
             if not target_region:
-                print(f"No region found for coordinates ({x}, {y})")
+                logger.debug("No region found for coordinates (%s, %s)", x, y)
                 return []
 
             units = target_region.get('units', [])
@@ -295,7 +309,7 @@ class DataManager:
             return orders
 
         except Exception as e:
-            print(f"An error occurred while getting orders for hex ({x}, {y}): {e}")
+            logger.error("An error occurred while getting orders for hex (%s, %s): %s", x, y, e)
             return []
 
     def get_engine_info(self) -> Dict[str, str]:
@@ -312,7 +326,7 @@ class DataManager:
         """
         try:
             if self.report_data is None:
-                print("No report data loaded. Please load a report first.")
+                logger.warning("No report data loaded. Please load a report first.")
                 return {
                     "ruleset": "Unknown",
                     "ruleset_version": "Unknown",
@@ -327,14 +341,14 @@ class DataManager:
             }
 
         except AttributeError as e:
-            print(f"Error accessing engine information: {e}")
+            logger.error("Error accessing engine information: %s", e)
             return {
                 "ruleset": "Unknown",
                 "ruleset_version": "Unknown",
                 "version": "Unknown"
             }
         except Exception as e:
-            print(f"An unexpected error occurred while getting engine info: {e}")
+            logger.error("An unexpected error occurred while getting engine info: %s", e)
             return {
                 "ruleset": "Unknown",
                 "ruleset_version": "Unknown",
@@ -356,7 +370,7 @@ class DataManager:
         """
         try:
             if self.report_data is None:
-                print("No report data loaded. Please load a report first.")
+                logger.warning("No report data loaded. Please load a report first.")
                 return {
                     "default": "neutral",
                     "ally": [],
@@ -377,7 +391,7 @@ class DataManager:
             }
 
         except AttributeError as e:
-            print(f"Error accessing attitude information: {e}")
+            logger.error("Error accessing attitude information: %s", e)
             return {
                 "default": "neutral",
                 "ally": [],
@@ -387,7 +401,7 @@ class DataManager:
                 "hostile": []
             }
         except Exception as e:
-            print(f"An unexpected error occurred while getting attitude info: {e}")
+            logger.error("An unexpected error occurred while getting attitude info: %s", e)
             return {
                 "default": "neutral",
                 "ally": [],
@@ -411,7 +425,7 @@ class DataManager:
         """
         try:
             if self.report_data is None:
-                print("No report data loaded. Please load a report first.")
+                logger.warning("No report data loaded. Please load a report first.")
                 return {
                     "email": "",
                     "password_unset": False,
@@ -428,7 +442,7 @@ class DataManager:
             }
 
         except AttributeError as e:
-            print(f"Error accessing administrative settings: {e}")
+            logger.error("Error accessing administrative settings: %s", e)
             return {
                 "email": "",
                 "password_unset": False,
@@ -436,7 +450,7 @@ class DataManager:
                 "times_sent": False
             }
         except Exception as e:
-            print(f"An unexpected error occurred while getting administrative settings: {e}")
+            logger.error("An unexpected error occurred while getting administrative settings: %s", e)
             return {
                 "email": "",
                 "password_unset": False,
@@ -462,3 +476,21 @@ class DataManager:
         """
         self.report_data = report_data
 
+    def get_display_title(self, region: Dict[str, Any]) -> str:
+        """
+        Get the heading shown for a region, e.g. "plain (12, 4) in Ardon".
+
+        MainWindow caches the rendered Hex Data page per hex, so this only
+        runs when a page is built.
+
+        Args:
+            region (Dict[str, Any]): The region data.
+
+        Returns:
+            str: The terrain, coordinates and capitalized province name.
+        """
+        coordinates = region.get('coordinates') or {}
+        x, y = coordinates.get('x', 'Unknown'), coordinates.get('y', 'Unknown')
+        province = region.get('province', 'Unknown').capitalize()
+        return f"{region.get('terrain')} ({x}, {y}) in {province}"
+
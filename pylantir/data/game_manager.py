@@ -1,6 +1,6 @@
-import json
 from pylantir.data.data_manager import DataManager
 from pylantir.data.map_manager import MapManager
+from pylantir.data.json_io import read_json, write_json
 
 class GameManager:
     def __init__(self, data_manager: DataManager, map_manager: MapManager):
@@ -9,8 +9,16 @@ class GameManager:
         self.map_manager = map_manager
 
     def load_game_data(self, filename: str):
-        with open(filename, 'r') as file:
-            self.game_data = json.load(file)
+        self.apply_game_data(read_json(filename))
+
+    def apply_game_data(self, game_data):
+        """
+        Hand already parsed game data to the MapManager and DataManager.
+
+        Args:
+            game_data (dict): The parsed save file, with 'map' and 'report' keys.
+        """
+        self.game_data = game_data
         
         # Convert map data to the format expected by MapManager
         map_data = self.game_data['map']
@@ -27,19 +35,27 @@ class GameManager:
         self.data_manager.set_report_data(report_data)
 
     def save_game_data(self, filename: str):
+        write_json(filename, self.get_save_data())
+
+    def get_save_data(self):
+        """
+        Gather the map and report data in the format written to disk.
+
+        The result shares the live region and report dicts; it is not a copy.
+
+        Returns:
+            dict: A dictionary with the 'map' region list and the 'report' data.
+        """
         map_data = self.map_manager.get_map_data()
         report_data = self.data_manager.get_report_data()
         
         # Convert map data back to list format for saving
         map_list = list(map_data.values())
         
-        save_data = {
+        return {
             'map': map_list,
             'report': report_data
         }
-        
-        with open(filename, 'w') as file:
-            json.dump(save_data, file, indent=4)
 
     def get_game_data(self):
         return self.game_data
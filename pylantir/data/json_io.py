@@ -0,0 +1,80 @@
+import json
+import os
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+
+def read_json(filename: str):
+    """
+    Read and parse a JSON file, using orjson when it is installed.
+
+    The file is read as bytes and decoded in one call. orjson.JSONDecodeError
+    subclasses json.JSONDecodeError, so callers only need to handle the latter.
+
+    Args:
+        filename (str): The path to the JSON file.
+
+    Returns:
+        The parsed JSON document.
+    """
+    with open(filename, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode_json(data) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON, using orjson when it is installed.
+
+    orjson only offers two-space indentation; the stdlib fallback keeps the
+    four spaces the save files have always used. Both are valid JSON and
+    read back the same.
+
+    Args:
+        data: The JSON-serializable data to encode.
+
+    Returns:
+        bytes: The encoded document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=4).encode('utf-8')
+
+
+def write_json(filename: str, data) -> None:
+    """
+    Serialize data to a JSON file with encode_json and write it with write_json_bytes.
+
+    Args:
+        filename (str): The path of the file to write.
+        data: The JSON-serializable data to write.
+    """
+    write_json_bytes(filename, encode_json(data))
+
+
+def write_json_bytes(filename: str, encoded: bytes) -> None:
+    """
+    Write an already encoded JSON document to a file.
+
+    The data is written to a temporary file next to the target and moved into
+    place with os.replace, so an interrupted write never leaves a truncated
+    file behind.
+
+    Args:
+        filename (str): The path of the file to write.
+        encoded (bytes): The document, as returned by encode_json.
+    """
+    temp_filename = f"{filename}.tmp"
+    try:
+        with open(temp_filename, 'wb') as f:
+            f.write(encoded)
+        os.replace(temp_filename, filename)
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
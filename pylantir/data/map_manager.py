@@ -61,5 +61,3 @@ class MapManager:
             self.map_data[key].update(region_data)
         else:
             self.map_data[key] = region_data
-        print(f"Region ({x}, {y}) updated/added in MapManager.")
-
@@ -1,10 +1,23 @@
 # pylantir/main.py
 
+import logging
+import os
 import sys
 from PySide6.QtWidgets import QApplication
 from pylantir.ui.main_window import MainWindow
 
+def log_level_from_env():
+    """Return the level named by PYLANTIR_LOG_LEVEL, or WARNING if it is unset or not a level name."""
+    level = logging.getLevelName(os.environ.get('PYLANTIR_LOG_LEVEL', 'WARNING').upper())
+    return level if isinstance(level, int) else logging.WARNING
+
 def main():
+    # Debug output is off unless asked for, e.g. PYLANTIR_LOG_LEVEL=DEBUG
+    logging.basicConfig(
+        level=log_level_from_env(),
+        format='%(levelname)s %(name)s: %(message)s'
+    )
+
     app = QApplication(sys.argv)
     
     window = MainWindow()
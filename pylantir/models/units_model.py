@@ -0,0 +1,178 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# Alignment for every cell; combining Qt flags allocates, so it is done once here
+CELL_ALIGNMENT = Qt.AlignLeft | Qt.AlignVCenter
+
+
+def format_unit_row(unit, structure_name=None):
+    """
+    Format a unit as a row of the data table.
+    
+    Args:
+        unit (dict): The unit data.
+        structure_name (str, optional): The name of the structure the unit belongs to. Defaults to None.
+
+    Returns:
+        tuple: The row's cell text, and a dict of tooltips keyed by column index.
+            Columns whose tooltip would repeat the cell text have no entry.
+    """
+    # Structure Display
+    structure_display = structure_name if structure_name else "None"
+
+    # Unit Name and Number
+    unit_name = unit.get('name', 'Unknown')
+    unit_number = unit.get('number', 'N/A')
+    role_display = f"{unit_name} ({unit_number})"
+
+    # Faction Information
+    faction = unit.get('faction', {})
+    faction_info = faction.get('name', 'Unknown Faction')
+    faction_number = faction.get('number', 'Hidden')
+    faction_display = f"{faction_info} (#{faction_number})" if faction_number else faction_info
+
+    # Status (from 'attitude')
+    status = f" {unit.get('attitude', 'neutral')} "
+
+    # Flags (from 'flags')
+    flags = unit.get('flags', {})
+    avoid_display = "Yes" if flags.get('avoid', False) else "No"
+    guard_display = "Yes" if flags.get('guard', False) else "No"
+
+    # Units Details (from 'items' or 'units')
+    units_details = unit.get('units') or unit.get('items') or []
+    if isinstance(units_details, list):
+        # Read each item's fields once, then build the cell text and the detailed tooltip from them
+        unit_parts = []
+        unit_lines = []
+        for item in units_details:
+            get = item.get
+            amount_name = f"{get('amount', '')}x {get('name', '')}"
+            unit_parts.append(amount_name)
+            unit_lines.append(f"{amount_name} ({get('tag', '')})")
+        units_display = " ; ".join(unit_parts)
+        detailed_units = "\n".join(unit_lines)
+    elif isinstance(units_details, dict):
+        units_display = f"Avoid: {avoid_display}, Guard: {guard_display}"
+        detailed_units = units_display
+    else:
+        units_display = str(units_details)
+        detailed_units = units_display
+
+    # Skills Extraction and Formatting
+    known_skills = unit.get('skills', {}).get('known', [])
+    if known_skills:
+        # Format: "Skill Name (Level X), Skill Name (Level Y)", with a detailed tooltip per skill
+        skill_parts = []
+        skill_lines = []
+        for skill in known_skills:
+            get = skill.get
+            name = get('name', 'Unknown Skill')
+            level = get('level', 'N/A')
+            skill_parts.append(f"{name} (Level {level})")
+            skill_lines.append(f"{name}: Level {level}, Days: {get('skill_days', 'N/A')}, Tag: {get('tag', 'N/A')}")
+        skills_display = ", ".join(skill_parts)
+        detailed_skills = "\n".join(skill_lines)
+    else:
+        skills_display = "None"
+        detailed_skills = "No known skills."
+
+    # Compile Table Data
+    table_data = (
+        structure_display,
+        role_display,
+        faction_display,
+        status,
+        avoid_display,
+        guard_display,
+        units_display,  
+        skills_display
+    )
+
+    # Tooltips for the 'Contains' and 'Skills' columns, left out where they would repeat the cell
+    tooltips = {}
+    if detailed_units != units_display:
+        tooltips[6] = detailed_units
+    if detailed_skills != skills_display:
+        tooltips[7] = detailed_skills
+    return table_data, tooltips
+
+
+
+class UnitsTableModel(QAbstractTableModel):
+    """
+    Read-only table model for the units in the selected hex.
+
+    Rows are held as tuples of preformatted cell text, so the view asks for
+    plain strings instead of keeping a QTableWidgetItem alive for every cell.
+    Sorting is left to a QSortFilterProxyModel so the rows are never reordered.
+    """
+
+    COLUMNS = (
+        "Structure",
+        "Unit Name",
+        "Faction Name",
+        "Status",
+        "Avoid",
+        "Guard",
+        "Contains",
+        "Skills"
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._tooltips = []
+
+    def set_rows(self, rows, tooltips=None):
+        """
+        Replace the contents of the model.
+
+        Args:
+            rows (list): A list of tuples of cell text, one tuple per row.
+            tooltips (list, optional): A dict per row mapping column index to tooltip text.
+        """
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._tooltips = list(tooltips) if tooltips is not None else [{}] * len(self._rows)
+        self.endResetModel()
+
+    def set_units(self, units):
+        """
+        Replace the contents of the model with formatted unit rows.
+
+        Args:
+            units (list): (unit dict, structure name or None) pairs, one per row.
+        """
+        rows = []
+        tooltips = []
+        for unit, structure_name in units:
+            row, row_tooltips = format_unit_row(unit, structure_name)
+            rows.append(row)
+            tooltips.append(row_tooltips)
+        self.set_rows(rows, tooltips)
+
+    def clear(self):
+        """Remove all rows from the model."""
+        self.set_rows([])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ToolTipRole:
+            return self._tooltips[index.row()].get(index.column())
+        if role == Qt.TextAlignmentRole:
+            return CELL_ALIGNMENT
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
@@ -1,15 +1,170 @@
-import json
+import logging
 from PySide6.QtWidgets import (
     QMainWindow, QFileDialog, QMessageBox, QLineEdit, QTextEdit,
-    QWidget, QVBoxLayout, QTableWidget, QSplitter, QTabWidget, QTableWidgetItem
+    QWidget, QVBoxLayout, QTableWidget, QTableView, QSplitter, QTabWidget, QHeaderView,
+    QProgressBar
 )
-from PySide6.QtGui import QAction, Qt, QPalette, QColor
+from PySide6.QtGui import QAction, Qt, QPalette, QColor, QTextDocument
+from PySide6.QtCore import QTimer, QThreadPool, QSortFilterProxyModel
 import os
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from string import Template
 
 from pylantir.views.hex_map import HexMapView  # We will create this later
 from pylantir.data.data_manager import DataManager
 from pylantir.data.map_manager import MapManager
 from pylantir.data.game_manager import GameManager
+from pylantir.models.units_model import UnitsTableModel
+from pylantir.ui.table_utils import fill_table
+from pylantir.ui.workers import LoadJsonTask
+
+logger = logging.getLogger(__name__)
+
+# Resolve file locations once at import instead of on every interaction
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_CSS_PATH = os.path.join(_MODULE_DIR, 'hexdata.css')
+
+# Regions placed on the map per event loop pass while a map loads
+_MAP_LOAD_CHUNK_SIZE = 500
+
+# Page skeleton for the Hex Data tab, parsed once and filled in per selection
+with open(os.path.join(_MODULE_DIR, 'hexdata.html'), 'r', encoding='utf-8') as _template_file:
+    _HEX_TEMPLATE = Template(_template_file.read())
+
+
+# Shared stand-in for missing sub-dicts in region data; only ever read, never mutated
+_EMPTY = {}
+
+# Sections of the Hex Data page, compiled once and filled in per hex
+_SETTLEMENT_SECTION = Template("""
+            <div class="section">
+                <p><b>Contains:</b> ${name} (${size})</p>
+            </div>
+            """)
+_PRODUCTS_HEAD = """
+            <div class="section">
+                <h2>Products</h2>
+                <table>
+                    <tr>
+                        <th>Product</th>
+                        <th>Amount</th>
+                    </tr>
+            """
+_PRODUCT_ROW = Template("""
+                    <tr>
+                        <td>${name}</td>
+                        <td>${amount}</td>
+                    </tr>
+                """)
+_PRODUCTS_TAIL = """
+                </table>
+            </div>
+            """
+_NO_PRODUCTS_SECTION = """
+            <div class="section">
+                <h2>Products</h2>
+                <p>None</p>
+            </div>
+            """
+_MARKETS_HEAD = """
+            <div class="section">
+            """
+_MARKET_TABLE_HEAD = Template("""
+                <div class="table-container">
+                    <h2>${heading}</h2>
+                    <table>
+                        <tr>
+                            <th>Item</th>
+                            <th>Amount</th>
+                            <th>Price (silver)</th>
+                        </tr>
+                """)
+_MARKET_ROW = Template("""
+                        <tr>
+                            <td>${name}</td>
+                            <td>${amount}</td>
+                            <td>${price}</td>
+                        </tr>
+                    """)
+_MARKET_TABLE_TAIL = """
+                    </table>
+                </div>
+                """
+_EMPTY_MARKET_TABLE = Template("""
+                <div class="table-container">
+                    <h2>${heading}</h2>
+                    <p>None</p>
+                </div>
+                """)
+_MARKETS_TAIL = """
+            </div> <!-- End of section div -->
+            """
+_NO_MARKETS_SECTION = """
+            <div class="section">
+                <h2>Market</h2>
+                <p>No market information available.</p>
+            </div>
+            """
+
+# Report summary shown in the Hex Data tab after a load, one line per field
+_REPORT_SUMMARY = (
+    "Faction: {faction[name]} [{faction[number]}]\n"
+    "Date: {date[month]}, Year {date[year]}\n"
+    "Engine: {engine[ruleset]} {engine[ruleset_version]}, Version {engine[version]}\n"
+    "Default Attitude: {attitudes[default]}\n"
+    "Password Unset: {admin[password_unset]}\n"
+    "Show Unit Attitudes: {admin[show_unit_attitudes]}\n"
+    "Times Sent: {admin[times_sent]}"
+)
+
+
+def _settlement_html(settlement):
+    """Format the settlement section of the Hex Data page."""
+    return _SETTLEMENT_SECTION.substitute(
+        name=settlement.get('name', 'Unknown'),
+        size=settlement.get('size', 'Unknown')
+    )
+
+
+def _products_html(products):
+    """Format the products table of the Hex Data page."""
+    parts = [_PRODUCTS_HEAD]
+    for product in products:
+        parts.append(_PRODUCT_ROW.substitute(
+            name=product.get('name', 'Unknown Product'),
+            amount=product.get('amount', 'N/A')
+        ))
+    parts.append(_PRODUCTS_TAIL)
+    return "".join(parts)
+
+
+def _markets_html(markets):
+    """Format the For Sale and Wanted tables of the Hex Data page."""
+    for_sale = markets.get('for_sale') or ()
+    wanted = markets.get('wanted') or ()
+    if not (for_sale or wanted):
+        # If neither for_sale nor wanted have items
+        return _NO_MARKETS_SECTION
+
+    # Remove the side-by-side class from the div
+    parts = [_MARKETS_HEAD]
+    for heading, items in (("For Sale", for_sale), ("Wanted", wanted)):
+        if items:
+            parts.append(_MARKET_TABLE_HEAD.substitute(heading=heading))
+            for item in items:
+                parts.append(_MARKET_ROW.substitute(
+                    name=item.get('name', 'Unknown Item'),
+                    amount=item.get('amount', 'N/A'),
+                    price=item.get('price', 'N/A')
+                ))
+            parts.append(_MARKET_TABLE_TAIL)
+        else:
+            parts.append(_EMPTY_MARKET_TABLE.substitute(heading=heading))
+    parts.append(_MARKETS_TAIL)
+    return "".join(parts)
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -26,6 +181,28 @@ class MainWindow(QMainWindow):
         palette.setColor(QPalette.Window, QColor(40, 40, 40))  # Dark gray
         self.setPalette(palette)
 
+        # Resolve {programdirectory}/reports once; it is created when a report is first opened
+        self._reports_dir = Path(__file__).resolve().parents[2] / 'reports'
+
+        # The Hex Data stylesheet does not change at runtime, so read it only once
+        try:
+            with open(_CSS_PATH, 'r', encoding='utf-8') as css_file:
+                self._css_content = css_file.read()
+        except FileNotFoundError:
+            logger.warning("CSS file not found at %s", _CSS_PATH)
+            self._css_content = ""  # Fallback to empty CSS if file not found
+
+        # Orders/Events are built lazily, only once their tab is shown
+        self._last_hex_data = None
+        self._dirty_tabs = set()
+
+        # Rendered Hex Data pages keyed by (x, y); cleared whenever new data is loaded
+        self._html_cache = {}
+        self._last_hex_key = None
+
+        # Iterator over the regions of the map load in progress, if any
+        self._region_iter = None
+
         self.init_ui()
 
     def init_ui(self):
@@ -105,9 +282,16 @@ class MainWindow(QMainWindow):
 
 
         # Create HexMapView and QTextEdit
-        self.data_table = QTableWidget()
-        self.data_table.setSortingEnabled(True)
-        self.data_table.setSelectionBehavior(QTableWidget.SelectRows)  # Make the table select rows
+        # The units table is a view over a model of preformatted rows, sorted through a proxy
+        self.units_model = UnitsTableModel(self)
+        self.units_proxy_model = QSortFilterProxyModel(self)
+        self.units_proxy_model.setSourceModel(self.units_model)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.units_proxy_model)
+        # Sorting is switched on, and the table shown, once the first report is loaded
+        self.data_table.setSortingEnabled(False)
+        self.data_table.setSelectionBehavior(QTableView.SelectRows)  # Make the table select rows
+        self.data_table.setEditTriggers(QTableView.NoEditTriggers)  # Make the table read-only
 
         # Set the grid line color to white
         self.data_table.setStyleSheet("""
@@ -142,34 +326,24 @@ class MainWindow(QMainWindow):
                 border: 1px solid #666666;  /* Border for the header */
             }
         """)
+        # Header behaviour is fixed for the lifetime of the table, so it is set once here
+        header.setStretchLastSection(True)
 
-        # Hide the vertical (row) header
+        # Hide the vertical (row) header and keep rows a fixed height, so Qt never measures row contents
         self.data_table.verticalHeader().setVisible(False)
+        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
 
         # Style the viewport to ensure it matches the table background
         self.data_table.viewport().setStyleSheet("""
             background-color: #333333;  /* Dark background for the viewport (including blank space after last row) */
         """)
-        # Define the columns you want to display
-        columns = [
-            "Structure",
-            "Unit Name",
-            "Faction Name",
-            "Status",
-            "Avoid",
-            "Guard",
-            "Contains",
-            "Skills"
-        ]
-
-        # Set table headers
-        self.data_table.setColumnCount(len(columns))
-        self.data_table.setHorizontalHeaderLabels(columns)
-        
+
         self.lower_tab_widget.addTab(self.data_table, "Units")
+        self.data_table.setVisible(False)
 
         self.hex_map_view = HexMapView(self.map_manager, self.data_manager, self.data_table)
         self.hex_map_view.setStyleSheet("background-color: #1F1F1F; border: 1px solid grey;")
+        self.hex_map_view.enable_opengl_viewport()
         self.hex_map_view.report_loaded.connect(self.update_status_bar)
         self.hex_map_view.hex_selected.connect(self.display_hex_data)
 
@@ -205,6 +379,12 @@ class MainWindow(QMainWindow):
         self.hex_data_tab = QTextEdit()
         self.hex_data_tab.setStyleSheet("background-color: #191919; color: white; border: 1px solid grey; padding: 10px;")
         self.hex_data_tab.setReadOnly(True)
+
+        # Keep one document with the Hex Data stylesheet installed as its default,
+        # so each page is parsed without an embedded <style> block
+        self._hex_document = QTextDocument(self.hex_data_tab)
+        self._hex_document.setDefaultStyleSheet(self._css_content)
+        self.hex_data_tab.setDocument(self._hex_document)
         self.tab_widget.addTab(self.hex_data_tab, "Hex Data")
 
         # Orders Tab
@@ -220,9 +400,14 @@ class MainWindow(QMainWindow):
             }
         """)
 
-        self.orders_tab.setColumnCount(2)
-        self.orders_tab.setHorizontalHeaderLabels(["Unit Name", "Order"])
-        self.orders_tab.horizontalHeader().setStretchLastSection(True)
+        self.orders_tab.setColumnCount(3)
+        self.orders_tab.setHorizontalHeaderLabels(["Unit Name", "Unit Number", "Orders"])
+        orders_header = self.orders_tab.horizontalHeader()
+        orders_header.setSectionResizeMode(0, QHeaderView.Interactive)
+        orders_header.setSectionResizeMode(1, QHeaderView.Interactive)
+        orders_header.setSectionResizeMode(2, QHeaderView.Stretch)
+        self.orders_tab.setColumnWidth(0, 160)
+        self.orders_tab.setColumnWidth(1, 100)
         self.orders_tab.setSelectionBehavior(QTableWidget.SelectRows)  # Make the table select rows
         self.orders_tab.setEditTriggers(QTableWidget.NoEditTriggers)  # Make the table read-only
         self.tab_widget.addTab(self.orders_tab, "Orders")
@@ -241,11 +426,20 @@ class MainWindow(QMainWindow):
         """)
         self.events_tab.setColumnCount(3)
         self.events_tab.setHorizontalHeaderLabels(["Unit","Category", "Message"])
-        self.events_tab.horizontalHeader().setStretchLastSection(True)
+        events_header = self.events_tab.horizontalHeader()
+        events_header.setSectionResizeMode(0, QHeaderView.Interactive)
+        events_header.setSectionResizeMode(1, QHeaderView.Interactive)
+        events_header.setSectionResizeMode(2, QHeaderView.Stretch)
+        self.events_tab.setColumnWidth(0, 160)
+        self.events_tab.setColumnWidth(1, 100)
         self.events_tab.setEditTriggers(QTableWidget.NoEditTriggers)  # Make the table read-only
         self.events_tab.setSelectionBehavior(QTableWidget.SelectRows)  # Make the table select rows
         self.lower_tab_widget.addTab(self.events_tab, "Events")
 
+        # Fill the Orders/Events tabs when they are brought to the front
+        self.tab_widget.currentChanged.connect(self.refresh_visible_tabs)
+        self.lower_tab_widget.currentChanged.connect(self.refresh_visible_tabs)
+
         # Create a vertical splitter for HexMapView (top) and DataTable (bottom)
         left_splitter = QSplitter()
         left_splitter.setOrientation(Qt.Vertical)
@@ -274,6 +468,13 @@ class MainWindow(QMainWindow):
         # Create and add the status bar
         self.statusBar().showMessage("Ready")  # Show a default message when the app starts
 
+        # Progress of report and save file loads, shown on the right of the status bar
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.hide()
+        self.statusBar().addPermanentWidget(self.progress_bar)
+
     def save_game_data(self):
         """Open a save file dialog and save the persistent game data."""
         filename, _ = QFileDialog.getSaveFileName(
@@ -293,25 +494,73 @@ class MainWindow(QMainWindow):
             filter="JSON Files (*.json)"
         )
         if filename:
-            self.game_manager.load_game_data(filename)
-            
-            # Retrieve map data as a list of regions
-            map_data = self.game_manager.get_map_data()
-            
-            # Retrieve report data if needed elsewhere
-            report_data = self.game_manager.data_manager.get_report_data()
-            
-            # Pass only the map data to HexMapView
-            self.hex_map_view.load_map_data(map_data)
-            
-            # Optionally, handle report_data as needed
-            self.display_parsed_data()
-            
-            self.statusBar().showMessage(f"Game data loaded from {filename}")
+            self.statusBar().showMessage(f"Loading game data from {filename}...")
+            self.show_progress()
+            self.start_json_load(filename, self._on_game_data_loaded)
         else:
             self.statusBar().showMessage("No game data loaded.")
             QMessageBox.warning(self, 'No File', 'No file was selected.')
 
+    def start_json_load(self, filename, on_loaded):
+        """
+        Parse a JSON file on the thread pool and pass the result to on_loaded.
+
+        Args:
+            filename (str): The path of the JSON file to load.
+            on_loaded (callable): Slot called on the GUI thread with the filename and parsed data.
+        """
+        task = LoadJsonTask(filename)
+        task.signals.finished.connect(on_loaded)
+        task.signals.failed.connect(self._on_load_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_load_failed(self, filename, message):
+        """Report a file that could not be read or parsed by a LoadJsonTask."""
+        logger.error("Error loading '%s': %s", filename, message)
+        if self._region_iter is None:
+            self.progress_bar.hide()
+        self.statusBar().showMessage(f"Could not load {filename}")
+        QMessageBox.warning(self, 'Load Failed', f"Could not load '{filename}':\n{message}")
+
+    def _on_report_loaded(self, filename, report_data):
+        """Apply a turn report parsed in the background and refresh the views."""
+        self.data_manager.apply_report(report_data)
+        self._html_cache.clear()
+        self.update_views()
+        self.statusBar().showMessage(f"Report loaded from {filename}")
+
+    def _on_game_data_loaded(self, filename, game_data):
+        """Apply game data parsed in the background and refresh the views."""
+        self.show_game_data(game_data)
+        self.statusBar().showMessage(f"Game data loaded from {filename}")
+
+    def show_progress(self, maximum=0):
+        """
+        Show the status bar progress bar.
+
+        Args:
+            maximum (int): The number of steps, or 0 for a busy indicator.
+        """
+        self.progress_bar.setRange(0, maximum)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+
+    def show_game_data(self, game_data):
+        """Hand parsed game data to the GameManager and show it on the map."""
+        self.game_manager.apply_game_data(game_data)
+        self._html_cache.clear()
+
+        # Pass only the map data to HexMapView
+        self.start_map_load(self.game_manager.get_map_data())
+        self.display_parsed_data()
+        self.show_units_table()
+
+    def show_units_table(self):
+        """Reveal the units table and enable sorting once there is data to show."""
+        if not self.data_table.isSortingEnabled():
+            self.data_table.setSortingEnabled(True)
+        self.data_table.setVisible(True)
+
     def toggle_hex_coords(self):
         """Toggle the hex coordinates labels on and off."""
         self.hex_map_view.toggle_hex_labels()
@@ -322,276 +571,109 @@ class MainWindow(QMainWindow):
     
     def display_hex_data(self, hex_data):
         """Display hex-specific data (including settlement data) in the text_display widget with a modern HTML/CSS layout."""
-        self.hex_data_tab.clear()  # Clear previous content
-        self.orders_tab.setRowCount(0)
-
-        # Read CSS content from the external file
-        css_file_path = os.path.join(os.path.dirname(__file__), 'hexdata.css')
-        try:
-            with open(css_file_path, 'r', encoding='utf-8') as css_file:
-                css_content = css_file.read()
-        except FileNotFoundError:
-            print(f"CSS file not found at {css_file_path}")
-            css_content = ""  # Fallback to empty CSS if file not found
-
-        # Start assembling HTML content
-        html_content = f"""
-        <html>
-        <head>
-        <style>
-        {css_content}
-        </style>
-        </head>
-        <body>
-        """
-
-        # Display basic hex information
-        coordinates = hex_data.get('coordinates', {})
-        x = coordinates.get('x', 'Unknown')
-        y = coordinates.get('y', 'Unknown')
+        coordinates = hex_data.get('coordinates') or _EMPTY
+        x, y = coordinates.get('x', 'Unknown'), coordinates.get('y', 'Unknown')
 
         self.statusBar().showMessage(f"Hex: ({x}, {y})")  # Show coordinates in status bar
 
-        # Display terrain type
-        terrain = hex_data.get('terrain')
-        province = hex_data.get('province', 'Unknown')
-        province = province.capitalize()
-        population = hex_data.get('population', {})
-        population_amount = population.get('amount', 'N/A')
-        population_race = population.get('race', 'N/A')
-        tax = hex_data.get('tax', 'N/A')
-        wages = hex_data.get('wages', {})
-        wages_amount = wages.get('amount', 'N/A')
-        wages_max = wages.get('max', 'N/A')
-        entertainment = hex_data.get('entertainment', 'N/A')
-
-        
-
-        html_content += f"""
-        <div class="section">
-            <p><h2>{terrain} ({x}, {y}) in {province}</h2></p>
-            <hr>
-           
-        </div>
-        """
-        
-        # Display settlement information
-        settlement = hex_data.get('settlement')
-        if settlement:
-            settlement_name = settlement.get('name', 'Unknown')
-            settlement_size = settlement.get('size', 'Unknown')
-            
-            html_content += f"""
-            <div class="section">
-                <p><b>Contains:</b> {settlement_name} ({settlement_size})</p>
-            </div>
-            """
-       
-        html_content += f"""
-        <div class="section">
-            <p><b>Tax Rate:</b> {tax if tax != 'N/A' else 'Not available'}</p>
-            <p><b>Max Wages:</b>  {wages_amount} (Max: {wages_max})</p>
-            <p><b>Population:</b> {population_amount} ({population_race}))</p>
-            <p><b>Entertainment available:</b> {entertainment}</p>
-        </div>
-        """
-
-       # Display products
-        products = hex_data.get('products', [])
-        
-        if products:
-            html_content += """
-            <div class="section">
-                <h2>Products</h2>
-                <table>
-                    <tr>
-                        <th>Product</th>
-                        <th>Amount</th>
-                    </tr>
-            """
-            for product in products:
-                product_name = product.get('name', 'Unknown Product')
-                product_amount = product.get('amount', 'N/A')
-                
-                html_content += f"""
-                    <tr>
-                        <td>{product_name}</td>
-                        <td>{product_amount}</td>
-                    </tr>
-                """
-            html_content += """
-                </table>
-            </div>
-            """
-        else:
-            html_content += """
-            <div class="section">
-                <h2>Products</h2>
-                <p>None</p>
-            </div>
-            """
-            
-        # Display market information (for_sale and wanted)
-        markets = hex_data.get('markets', {})
-
-        for_sale = markets.get('for_sale', [])
-        wanted = markets.get('wanted', [])
+        # Re-selecting the hex already on display needs no new layout pass
+        key = (x, y)
+        if key == self._last_hex_key:
+            return
+        self._last_hex_key = key
 
-        if for_sale or wanted:
-            # Remove the side-by-side class from the div
-            html_content += """
-            <div class="section">
-            """
-            
-            if for_sale:
-                html_content += """
-                <div class="table-container">
-                    <h2>For Sale</h2>
-                    <table>
-                        <tr>
-                            <th>Item</th>
-                            <th>Amount</th>
-                            <th>Price (silver)</th>
-                        </tr>
-                """
-                for item in for_sale:
-                    item_name = item.get('name', 'Unknown Item')
-                    item_amount = item.get('amount', 'N/A')
-                    item_price = item.get('price', 'N/A')
-                    
-                    html_content += f"""
-                        <tr>
-                            <td>{item_name}</td>
-                            <td>{item_amount}</td>
-                            <td>{item_price}</td>
-                        </tr>
-                    """
-                html_content += """
-                    </table>
-                </div>
-                """
-            else:
+        # Reuse the page built on an earlier visit to this hex
+        html_content = self._html_cache.get(key)
+        if html_content is None:
+            html_content = self.build_hex_html(hex_data)
+            self._html_cache[key] = html_content
 
-                html_content += """
-                <div class="table-container">
-                    <h2>For Sale</h2>
-                    <p>None</p>
-                </div>
-                """
-            
-            if wanted:
-                html_content += """
-                <div class="table-container">
-                    <h2>Wanted</h2>
-                    <table>
-                        <tr>
-                            <th>Item</th>
-                            <th>Amount</th>
-                            <th>Price (silver)</th>
-                        </tr>
-                """
-                for item in wanted:
-                    item_name = item.get('name', 'Unknown Item')
-                    item_amount = item.get('amount', 'N/A')
-                    item_price = item.get('price', 'N/A')
+        # Set the HTML content to the text_display widget
+        self.hex_data_tab.setHtml(html_content)
 
-                    html_content += f"""
-                        <tr>
-                            <td>{item_name}</td>
-                            <td>{item_amount}</td>
-                            <td>{item_price}</td>
-                        </tr>
-                    """
-                html_content += """
-                    </table>
-                </div>
-                """
-            else:
+        # Mark the Orders and Events tabs stale and only fill the visible ones
+        self._last_hex_data = hex_data
+        self._dirty_tabs = {'orders', 'events'}
+        self.refresh_visible_tabs()
 
-                html_content += """
-                <div class="table-container">
-                    <h2>Wanted</h2>
-                    <p>None</p>
-                </div>
-                """
-            
-            html_content += """
-            </div> <!-- End of section div -->
-            """
-        else:
-            # If neither for_sale nor wanted have items
-            html_content += """
-            <div class="section">
-                <h2>Market</h2>
-                <p>No market information available.</p>
-            </div>
-            """
-        
+    def build_hex_html(self, hex_data):
+        """
+        Build the Hex Data page for a region.
 
+        Args:
+            hex_data (dict): The region data of the selected hex.
 
-        # Close HTML tags
-        html_content += """
-        </body>
-        </html>
+        Returns:
+            str: The HTML page shown in the Hex Data tab.
         """
+        get = hex_data.get
+
+        # Unpack each nested section once
+        population = get('population') or _EMPTY
+        population_amount, population_race = population.get('amount', 'N/A'), population.get('race', 'N/A')
+        tax = get('tax', 'N/A')
+        wages = get('wages') or _EMPTY
+        wages_amount, wages_max = wages.get('amount', 'N/A'), wages.get('max', 'N/A')
+        entertainment = get('entertainment', 'N/A')
+
+        # Format only the sections the region actually has; the rest use fixed placeholders
+        settlement = get('settlement')
+        products = get('products')
+        markets = get('markets')
+        settlement_html = _settlement_html(settlement) if settlement else ""
+        products_html = _products_html(products) if products else _NO_PRODUCTS_SECTION
+        markets_html = _markets_html(markets) if markets else _NO_MARKETS_SECTION
+
+        # Fill in the precompiled page template
+        return _HEX_TEMPLATE.substitute(
+            title=self.data_manager.get_display_title(hex_data),
+            settlement=settlement_html,
+            tax=tax if tax != 'N/A' else 'Not available',
+            wages_amount=wages_amount,
+            wages_max=wages_max,
+            population_amount=population_amount,
+            population_race=population_race,
+            entertainment=entertainment,
+            products=products_html,
+            markets=markets_html
+        )
 
-        # Set the HTML content to the text_display widget
-        self.hex_data_tab.setHtml(html_content)
+    def refresh_visible_tabs(self, index=None):
+        """Populate the Orders/Events tabs for the selected hex if they are showing and out of date."""
+        if self._last_hex_data is None:
+            return
 
-        # Now, populate the Orders tab
-        self.populate_orders_tab(hex_data)
+        if 'orders' in self._dirty_tabs and self.tab_widget.currentWidget() is self.orders_tab:
+            self._dirty_tabs.discard('orders')
+            self.populate_orders_tab(self._last_hex_data)
 
-        # Populate the Events tab
-        self.populate_events_tab(hex_data)
+        if 'events' in self._dirty_tabs and self.lower_tab_widget.currentWidget() is self.events_tab:
+            self._dirty_tabs.discard('events')
+            self.populate_events_tab(self._last_hex_data)
 
     def populate_orders_tab(self, hex_data):
         """Populate the Orders tab with orders from units in the hex."""
-        self.orders_tab.setRowCount(0)
-        self.orders_tab.setColumnCount(3)
-        self.orders_tab.setHorizontalHeaderLabels(["Unit Name", "Unit Number", "Orders"])
-
-        coordinates = hex_data.get('coordinates', {})
+        coordinates = hex_data.get('coordinates') or _EMPTY
         x, y = coordinates.get('x'), coordinates.get('y')
 
         if x is None or y is None:
-            print(f"Warning: Invalid coordinates in hex_data: {coordinates}")
+            logger.warning("Invalid coordinates in hex_data: %s", coordinates)
+            self.orders_tab.setRowCount(0)
             return
 
         orders = self.data_manager.get_orders_for_hex(x, y)
 
         if orders:
-            for unit_order in orders:
-                unit_name = unit_order['unit_name']
-                unit_number = unit_order['unit_number']
-                unit_orders = unit_order['orders']
-
-                for order in unit_orders:
-                    row_position = self.orders_tab.rowCount()
-                    self.orders_tab.insertRow(row_position)
-                    
-                    self.orders_tab.setItem(row_position, 0, QTableWidgetItem(str(unit_name)))
-                    self.orders_tab.setItem(row_position, 1, QTableWidgetItem(str(unit_number)))
-                    self.orders_tab.setItem(row_position, 2, QTableWidgetItem(str(order)))
-
-            print(f"Set Orders tab with {self.orders_tab.rowCount()} rows for region ({x}, {y})")
+            rows = [
+                (str(unit_order['unit_name']), str(unit_order['unit_number']), str(order))
+                for unit_order in orders
+                for order in unit_order['orders']
+            ]
+            fill_table(self.orders_tab, rows)
+            logger.debug("Set Orders tab with %d rows for region (%s, %s)", len(rows), x, y)
         else:
-            self.orders_tab.setRowCount(1)
-            self.orders_tab.setItem(0, 0, QTableWidgetItem("No Orders"))
-            self.orders_tab.setItem(0, 1, QTableWidgetItem(""))
-            self.orders_tab.setItem(0, 2, QTableWidgetItem(""))
-            print("No orders to display in Orders tab.")
-
-        # Adjust the table for better readability
-        self.orders_tab.resizeColumnsToContents()
-        self.orders_tab.horizontalHeader().setStretchLastSection(True)
-        self.orders_tab.setSortingEnabled(True)
-
-        # Optionally, set alignment for all cells
-        for row in range(self.orders_tab.rowCount()):
-            for col in range(self.orders_tab.columnCount()):
-                item = self.orders_tab.item(row, col)
-                if item:
-                    item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+            fill_table(self.orders_tab, [("No Orders", "", "")])
+            logger.debug("No orders to display in Orders tab.")
 
     def populate_events_tab(self, hex_data):
         """
@@ -600,27 +682,21 @@ class MainWindow(QMainWindow):
         Args:
             hex_data (dict): The data associated with the selected hex tile.
         """
-        coordinates = hex_data.get('coordinates', {})
+        coordinates = hex_data.get('coordinates') or _EMPTY
         x = coordinates.get('x')
         y = coordinates.get('y')
         
         if x is None or y is None:
-            print(f"Warning: Invalid coordinates in hex_data: {coordinates}")
+            logger.warning("Invalid coordinates in hex_data: %s", coordinates)
             return
 
         # Use the new DataManager method to get all unique events for the hex
         events = self.data_manager.get_all_events_for_hex(x, y)
-        print(f"Found {len(events)} events for region ({x}, {y})")  # Debug statement
-        
-        self.events_tab.clearContents()  # Clear previous content
-        self.events_tab.setRowCount(0)   # Reset the table
+        logger.debug("Found %d events for region (%s, %s)", len(events), x, y)
 
         if events:
-            self.events_tab.setRowCount(len(events))
-            self.events_tab.setColumnCount(3)  # Update to 3 columns
-            self.events_tab.setHorizontalHeaderLabels(["Unit", "Category", "Message"])  # Set headers accordingly
-
-            for row, event in enumerate(events):
+            rows = []
+            for event in events:
                 # Unit
                 unit = event.get('unit')
                 if unit:
@@ -629,77 +705,46 @@ class MainWindow(QMainWindow):
                     unit_text = f"{unit_name} (#{unit_number})"
                 else:
                     unit_text = "N/A"
-                unit_item = QTableWidgetItem(unit_text)
-                unit_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                self.events_tab.setItem(row, 0, unit_item)  # Column 0: Unit
 
                 # Category
                 category = event.get('category', 'N/A').capitalize()
-                category_item = QTableWidgetItem(category)
-                category_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                self.events_tab.setItem(row, 1, category_item)  # Column 1: Category
 
                 # Message
                 message = event.get('message', 'No message provided.')
-                message_item = QTableWidgetItem(message)
-                message_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                self.events_tab.setItem(row, 2, message_item)  # Column 2: Message
 
-                print(f"Set Events tab row {row}: Unit='{unit_text}', Category='{category}', Message='{message}'")
+                rows.append((unit_text, category, message))
+
+            fill_table(self.events_tab, rows)
         else:
             # No events to display
-            self.events_tab.setRowCount(1)
+            fill_table(self.events_tab, [("No events to display.", "", "")], alignment=Qt.AlignCenter)
             self.events_tab.setSpan(0, 0, 1, 3)  # Span across all three columns
-            no_event_item = QTableWidgetItem("No events to display.")
-            no_event_item.setTextAlignment(Qt.AlignCenter)
-            self.events_tab.setItem(0, 0, no_event_item)
-        
-        # Adjust the table for better readability
-        self.events_tab.resizeColumnsToContents()
-        self.events_tab.horizontalHeader().setStretchLastSection(True)
-        self.events_tab.setSortingEnabled(True)
-
-        # Optionally, set alignment for all cells
-        for row in range(self.events_tab.rowCount()):
-            for col in range(self.events_tab.columnCount()):
-                item = self.events_tab.item(row, col)
-                if item:
-                    item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-
 
     def open_turn_report(self):
         """Open a turn report file and load its data into the application."""
-        options = QFileDialog.Options()
-        
-        # Get the root directory by going up two levels from the current file location
-        program_directory = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-        reports_directory = os.path.join(program_directory, 'reports')  # Append 'reports' directory
-
-        # Create the directory if it doesn't exist
-        if not os.path.exists(reports_directory):
-            os.makedirs(reports_directory)
+        # Start in {programdirectory}/reports; on a read-only install let the dialog pick its default
+        try:
+            self._reports_dir.mkdir(exist_ok=True)
+            start_directory = str(self._reports_dir)
+        except OSError as e:
+            logger.warning("Could not create the reports directory %s: %s", self._reports_dir, e)
+            start_directory = ''
 
         filename, _ = QFileDialog.getOpenFileName(
             self,
             'Open JSON Turn Report',
-            reports_directory,  # Set the initial directory to {programdirectory}/reports
-            'JSON Files (*.json);;All Files (*)',
-            options=options
+            start_directory,
+            'JSON Files (*.json);;All Files (*)'
         )
 
         if filename:
-            self.data_manager.load_report(filename)
-            self.update_views()
+            self.statusBar().showMessage(f"Loading {filename}...")
+            self.show_progress()
+            self.start_json_load(filename, self._on_report_loaded)
         else:
             self.statusBar().showMessage("No file selected")
             QMessageBox.warning(self, 'No File', 'No file was selected.')
 
-    def update_views(self):
-        """Update the hex map view with the latest region data."""
-        regions = self.map_manager.get_map_data()  # Use MapManager data instead of DataMngr
-        self.hex_map_view.load_map_data(regions)
-        self.display_parsed_data()
-
     def closeEvent(self, event):
         """
         This method can be simplified as we're continuously updating the MapManager.
@@ -711,33 +756,65 @@ class MainWindow(QMainWindow):
     def update_views(self):
         """Update the hex map view with the latest region data."""
         regions = self.data_manager.get_regions()
-        self.hex_map_view.load_map_data(regions)
+        self.start_map_load(regions)
         self.display_parsed_data()
+        self.show_units_table()
+
+    def start_map_load(self, regions):
+        """
+        Place regions on the map a chunk at a time so the window keeps responding.
+
+        Each chunk is handed to HexMapView.add_regions from its own event loop
+        pass. Starting a new load abandons one that is still in progress.
+
+        Args:
+            regions (list): The region dicts to place on the map.
+        """
+        try:
+            ordered_regions = self.hex_map_view.begin_map_load(regions)
+        except Exception as e:
+            self._region_iter = None
+            self.progress_bar.hide()
+            self.hex_map_view.abort_map_load(e)
+            return
+
+        self.show_progress(len(ordered_regions))
+        self._region_iter = iter(ordered_regions)
+        self._load_next_chunk(self._region_iter)
+
+    def _load_next_chunk(self, region_iter):
+        """Place the next chunk of regions and schedule the one after it."""
+        if region_iter is not self._region_iter:
+            return  # Superseded by a newer load
+
+        try:
+            batch = list(islice(region_iter, _MAP_LOAD_CHUNK_SIZE))
+            if batch:
+                self.hex_map_view.add_regions(batch)
+                self.progress_bar.setValue(self.progress_bar.value() + len(batch))
+                QTimer.singleShot(0, partial(self._load_next_chunk, region_iter))
+            else:
+                self._region_iter = None
+                self.progress_bar.hide()
+                self.hex_map_view.finish_map_load()
+        except Exception as e:
+            self._region_iter = None
+            self.progress_bar.hide()
+            self.hex_map_view.abort_map_load(e)
 
     def display_parsed_data(self):
-        self.hex_data_tab.clear()  # Clear previous content
         """Display faction, date, and engine information in the hex_data_tab widget."""
-        # Display faction information
-        faction_info = self.data_manager.get_faction_info()
-        self.hex_data_tab.append(f"Faction: {faction_info['name']} [{faction_info['number']}]")
-
-        # Display date information
-        date_info = self.data_manager.get_date_info()
-        self.hex_data_tab.append(f"Date: {date_info['month']}, Year {date_info['year']}")
-
-        # Display engine information
-        engine_info = self.data_manager.get_engine_info()
-        self.hex_data_tab.append(f"Engine: {engine_info['ruleset']} {engine_info['ruleset_version']}, Version {engine_info['version']}")
-
-        # Display attitudes
-        attitudes = self.data_manager.get_attitudes()
-        self.hex_data_tab.append(f"Default Attitude: {attitudes['default']}")
-
-        # Display administrative settings
-        admin_settings = self.data_manager.get_administrative_settings()
-        self.hex_data_tab.append(f"Password Unset: {admin_settings['password_unset']}")
-        self.hex_data_tab.append(f"Show Unit Attitudes: {admin_settings['show_unit_attitudes']}")
-        self.hex_data_tab.append(f"Times Sent: {admin_settings['times_sent']}")
+        summary = _REPORT_SUMMARY.format(
+            faction=self.data_manager.get_faction_info(),
+            date=self.data_manager.get_date_info(),
+            engine=self.data_manager.get_engine_info(),
+            attitudes=self.data_manager.get_attitudes(),
+            admin=self.data_manager.get_administrative_settings()
+        )
+
+        # Replace the previous content in one go rather than relaying out per line
+        self.hex_data_tab.setPlainText(summary)
+        self._last_hex_key = None
 
     def show_about(self):
         """Show the about dialog."""
@@ -1,23 +1,130 @@
 
-from PySide6.QtWidgets import QGraphicsItemGroup, QGraphicsEllipseItem, QGraphicsRectItem, QGraphicsPolygonItem
-from PySide6.QtCore import Qt, QPointF
-from PySide6.QtGui import QPen, QBrush, QColor, QPolygonF
+import math
+
+from PySide6.QtWidgets import (
+    QGraphicsItemGroup, QGraphicsEllipseItem, QGraphicsRectItem, QGraphicsPolygonItem,
+    QGraphicsPixmapItem, QGraphicsScene
+)
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import QPen, QBrush, QColor, QPolygonF, QPixmap, QPainter
+
+# Shared pens and brushes; items copy them on setPen/setBrush, so one instance serves all markers
+NO_PEN = QPen(Qt.NoPen)
+WHITE = QColor('white')
+WHITE_BRUSH = QBrush(WHITE)
 
 
 class Markers:
+    # Rendered marker images keyed by marker kind and style, shared by all instances
+    _pixmap_cache = {}
+
+    # Markers are rasterized at this multiple of their scene size so they stay sharp when zoomed in
+    OVERSAMPLE = 4
+
     def create_triangle_marker(self, color='white', size=10, circle_color='white', circle_size=4):
-            """
-            Create a triangle marker with a small circle at the top.
-
-            Args:
-                color (str): Color of the triangle.
-                size (int): Size of the triangle.
-                circle_color (str): Color of the circle.
-                circle_size (int): Diameter of the circle.
-
-            Returns:
-                QGraphicsItemGroup: A group containing the triangle and the circle.
-            """
+        """
+        Create a triangle marker with a small circle at the top.
+
+        Args:
+            color (str): Color of the triangle.
+            size (int): Size of the triangle.
+            circle_color (str): Color of the circle.
+            circle_size (int): Diameter of the circle.
+
+        Returns:
+            QGraphicsPixmapItem: The marker, centered on its origin.
+        """
+        return self._cached_marker(
+            ('triangle', color, size, circle_color, circle_size),
+            lambda: self._triangle_group(color, size, circle_color, circle_size)
+        )
+
+    def create_ring_with_dot_marker(self, ring_color='white', dot_color='white', outer_diameter=10, ring_thickness=2, dot_diameter=2):
+        """
+        Create a ring with a small dot in the center, leaving a transparent space between the ring and the dot.
+        
+        Args:
+            ring_color (str): Color of the outer ring.
+            dot_color (str): Color of the dot in the center.
+            outer_diameter (int): Diameter of the outer ring.
+            ring_thickness (int): Thickness of the ring.
+            dot_diameter (int): Diameter of the center dot.
+            
+        Returns:
+            QGraphicsPixmapItem: The ring with a dot marker.
+        """
+        return self._cached_marker(
+            ('ring_with_dot', ring_color, dot_color, outer_diameter, ring_thickness, dot_diameter),
+            lambda: self._ring_with_dot_group(ring_color, dot_color, outer_diameter, ring_thickness, dot_diameter)
+        )
+
+    def create_hollow_box_marker(self, box_color='white', outer_size=10, box_thickness=2):
+        """
+        Create a hollow box/square marker with specified color, size, and thickness.
+            
+        Args:
+            box_color (str): Color of the box outline.
+            outer_size (int): Size (width and height) of the outer box.
+            box_thickness (int): Thickness of the box outline.
+                
+        Returns:
+            QGraphicsPixmapItem: The hollow box marker.
+        """
+        return self._cached_marker(
+            ('hollow_box', box_color, outer_size, box_thickness),
+            lambda: self._hollow_box_group(box_color, outer_size, box_thickness)
+        )
+
+    def _cached_marker(self, key, build_group):
+        """
+        Return a pixmap item showing the marker for key, rasterizing it on first use.
+
+        Args:
+            key (tuple): The marker kind followed by its style arguments.
+            build_group (callable): Builds the marker as a QGraphicsItemGroup on a cache miss.
+
+        Returns:
+            QGraphicsPixmapItem: A new item sharing the cached pixmap.
+        """
+        cached = Markers._pixmap_cache.get(key)
+        if cached is None:
+            cached = self._rasterize(build_group())
+            Markers._pixmap_cache[key] = cached
+        pixmap, offset = cached
+
+        # The pixmap is OVERSAMPLE times the marker size; scale it back down around the origin
+        item = QGraphicsPixmapItem(pixmap)
+        item.setOffset(offset)
+        item.setScale(1 / self.OVERSAMPLE)
+        item.setTransformationMode(Qt.SmoothTransformation)
+        item.setZValue(2)
+        return item
+
+    def _rasterize(self, group):
+        """
+        Paint a marker group into a transparent pixmap.
+
+        Returns:
+            tuple: The pixmap and the offset that puts the group's origin back at (0, 0).
+        """
+        scene = QGraphicsScene()
+        scene.addItem(group)
+        source = group.sceneBoundingRect()  # Includes the pen width of outlines
+
+        scale = self.OVERSAMPLE
+        target = QRectF(0, 0, source.width() * scale, source.height() * scale)
+        pixmap = QPixmap(math.ceil(target.width()), math.ceil(target.height()))
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        scene.render(painter, target, source)
+        painter.end()
+
+        return pixmap, QPointF(source.left() * scale, source.top() * scale)
+
+    def _triangle_group(self, color, size, circle_color, circle_size):
+            """Build the triangle marker as a QGraphicsItemGroup of a triangle and a circle."""
             # 1. Define the points for the triangle
             points = [
                 QPointF(0, -size / 2),            # Top point
@@ -26,7 +133,7 @@ class Markers:
             ]
             triangle = QGraphicsPolygonItem(QPolygonF(points))
             triangle.setBrush(QBrush(QColor(color)))
-            triangle.setPen(QPen(Qt.NoPen))  # No border
+            triangle.setPen(NO_PEN)  # No border
 
             # Set the triangle's origin to the center
             triangle.setTransformOriginPoint(0, 0)
@@ -44,7 +151,7 @@ class Markers:
                 circle_size
             )
             circle.setBrush(QBrush(QColor(circle_color)))
-            circle.setPen(QPen(Qt.NoPen))  # No border
+            circle.setPen(NO_PEN)  # No border
 
             # Set the circle's origin to the center
             circle.setTransformOriginPoint(0, 0)
@@ -66,20 +173,8 @@ class Markers:
             return group
 
 
-    def create_ring_with_dot_marker(self, ring_color='white', dot_color='white', outer_diameter=10, ring_thickness=2, dot_diameter=2):
-        """
-        Create a ring with a small dot in the center, leaving a transparent space between the ring and the dot.
-        
-        Args:
-            ring_color (str): Color of the outer ring.
-            dot_color (str): Color of the dot in the center.
-            outer_diameter (int): Diameter of the outer ring.
-            ring_thickness (int): Thickness of the ring.
-            dot_diameter (int): Diameter of the center dot.
-            
-        Returns:
-            QGraphicsItemGroup: The ring with a dot marker.
-        """
+    def _ring_with_dot_group(self, ring_color, dot_color, outer_diameter, ring_thickness, dot_diameter):
+        """Build the ring with a dot marker as a QGraphicsItemGroup."""
         # Create the outer ring (with transparent center)
         outer_ring = QGraphicsEllipseItem(-outer_diameter / 2, -outer_diameter / 2, outer_diameter, outer_diameter)
         outer_ring.setBrush(Qt.NoBrush)  # No fill to create the transparent center
@@ -88,7 +183,7 @@ class Markers:
         # Create the center dot
         center_dot = QGraphicsEllipseItem(-dot_diameter / 2, -dot_diameter / 2, dot_diameter, dot_diameter)
         center_dot.setBrush(QBrush(QColor(dot_color)))  # Set the color of the center dot
-        center_dot.setPen(QPen(Qt.NoPen))  # No border
+        center_dot.setPen(NO_PEN)  # No border
             
         # Create a group item to combine the ring and dot
         group = QGraphicsItemGroup()
@@ -100,18 +195,8 @@ class Markers:
 
         return group
 
-    def create_hollow_box_marker(self, box_color='white', outer_size=10, box_thickness=2):
-        """
-        Create a hollow box/square marker with specified color, size, and thickness.
-            
-        Args:
-            box_color (str): Color of the box outline.
-            outer_size (int): Size (width and height) of the outer box.
-            box_thickness (int): Thickness of the box outline.
-                
-        Returns:
-            QGraphicsItemGroup: The hollow box marker.
-        """
+    def _hollow_box_group(self, box_color, outer_size, box_thickness):
+        """Build the hollow box marker as a QGraphicsItemGroup."""
         # Create the outer box (with transparent center)
         outer_box = QGraphicsRectItem(-outer_size / 2, -outer_size / 2, outer_size, outer_size)
         outer_box.setBrush(Qt.NoBrush)  # No fill to create the transparent center
@@ -123,11 +208,10 @@ class Markers:
         
         # Add a center dot (similar to the ring with a dot)
                 
-        dot_color = 'white'  # You can parameterize this if needed
         dot_diameter = outer_size / 4  # Adjust size as needed
         center_dot = QGraphicsEllipseItem(-dot_diameter / 2, -dot_diameter / 2, dot_diameter, dot_diameter)
-        center_dot.setBrush(QBrush(QColor(dot_color)))  # Set the color of the center dot
-        center_dot.setPen(QPen(Qt.NoPen))  # No border for the dot
+        center_dot.setBrush(WHITE_BRUSH)  # The box dot is always white
+        center_dot.setPen(NO_PEN)  # No border for the dot
         group.addToGroup(center_dot)  # Add the center dot to the group
         
         # Set the Z-value to ensure it's drawn above other items
@@ -0,0 +1,68 @@
+from contextlib import contextmanager
+
+from PySide6.QtWidgets import QTableWidgetItem
+from PySide6.QtCore import Qt
+
+# Alignment of table cells unless a caller asks for another
+DEFAULT_ALIGNMENT = Qt.AlignLeft | Qt.AlignVCenter
+
+
+class AlignedTableItem(QTableWidgetItem):
+    """A table item that is left-aligned and vertically centered on construction."""
+
+    def __init__(self, text="", alignment=DEFAULT_ALIGNMENT):
+        super().__init__(text)
+        self.setTextAlignment(alignment)
+
+
+@contextmanager
+def batched_update(table):
+    """
+    Suspend sorting, repaints and signals on a table while it is filled in bulk.
+
+    With sorting enabled, QTableWidget re-sorts after every setItem; this
+    turns it off for the duration of the block and restores the previous
+    state afterwards, so the table is sorted and repainted once. It works
+    the same for a QTableView whose model is reset inside the block.
+
+    Args:
+        table (QTableView): The table about to be filled.
+    """
+    sorting_enabled = table.isSortingEnabled()
+    table.setSortingEnabled(False)
+    table.setUpdatesEnabled(False)
+    signals_blocked = table.blockSignals(True)
+    try:
+        yield table
+    finally:
+        table.blockSignals(signals_blocked)
+        table.setUpdatesEnabled(True)
+        table.setSortingEnabled(sorting_enabled)
+
+
+def fill_table(table, rows, alignment=DEFAULT_ALIGNMENT):
+    """
+    Fill a QTableWidget with rows of text, reusing the items already in the table.
+
+    Items that already exist are updated in place with setText, new items are
+    only created for rows beyond the current row count, and surplus rows are
+    dropped. Sorting and repaints are suspended while the cells are written.
+
+    Args:
+        table (QTableWidget): The table to fill.
+        rows (list): A list of tuples of cell text, one tuple per row.
+        alignment (Qt.Alignment): Text alignment for every cell, including reused ones.
+    """
+    with batched_update(table):
+        table.clearSpans()
+        existing_rows = table.rowCount()
+        table.setRowCount(len(rows))
+
+        for row, values in enumerate(rows):
+            for col, text in enumerate(values):
+                item = table.item(row, col) if row < existing_rows else None
+                if item is None:
+                    table.setItem(row, col, AlignedTableItem(text, alignment))
+                else:
+                    item.setText(text)
+                    item.setTextAlignment(alignment)
@@ -0,0 +1,31 @@
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from pylantir.data.json_io import read_json
+
+
+class LoadJsonSignals(QObject):
+    """Signals for LoadJsonTask; QRunnable is not a QObject and cannot emit them itself."""
+    finished = Signal(str, object)
+    failed = Signal(str, str)
+
+
+class LoadJsonTask(QRunnable):
+    """
+    Read and parse a JSON file on a QThreadPool worker thread.
+
+    The parsed document is delivered through signals.finished on the thread
+    that owns the connected slot, so the slot can update models and widgets.
+    """
+
+    def __init__(self, filename):
+        super().__init__()
+        self.filename = filename
+        self.signals = LoadJsonSignals()
+
+    def run(self):
+        try:
+            data = read_json(self.filename)
+        except Exception as e:
+            self.signals.failed.emit(self.filename, str(e))
+        else:
+            self.signals.finished.emit(self.filename, data)
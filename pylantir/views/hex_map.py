@@ -1,22 +1,39 @@
 # hex_map.py
 
+import logging
+
 from PySide6.QtWidgets import (
-    QGraphicsRectItem, QGraphicsView, QGraphicsScene, QTableWidgetItem, QGraphicsPolygonItem,
-    QGraphicsEllipseItem, QGraphicsItemGroup, QTableWidget
+    QGraphicsRectItem, QGraphicsView, QGraphicsScene, QGraphicsPolygonItem,
+    QGraphicsEllipseItem, QGraphicsItemGroup, QTableView
     )
-from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QPolygonF
-from PySide6.QtCore import Qt, QPointF, Signal, QObject, QRectF
-from collections import defaultdict
-from pylantir.views.hex_tile import HexTile
+from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QPolygonF, QSurfaceFormat
+from PySide6.QtCore import Qt, QPoint, Signal, QObject, QRectF, QTimer
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # Qt built without OpenGL support; keep the raster viewport
+    QOpenGLWidget = None
+from pylantir.views.hex_tile import HexTile, OUTLINE_MIN_LOD, scene_to_hex
 from pylantir.ui.markers import Markers
+from pylantir.ui.table_utils import batched_update
 from pylantir.data.data_manager import DataManager  # Add this import
 from pylantir.data.map_manager import MapManager
+
+logger = logging.getLogger(__name__)
+
+
 class HexMapView(QGraphicsView):
     # Define custom signals
     report_loaded = Signal(str)
     hex_selected = Signal(dict)  # Emits the full region data
 
-    def __init__(self, map_manager: MapManager, data_manager: DataManager, data_table: QTableWidget):
+    # Scale applied per wheel tick, and how long to wait for further ticks before applying it
+    ZOOM_IN_FACTOR = 1.15
+    ZOOM_OUT_FACTOR = 1 / ZOOM_IN_FACTOR
+    ZOOM_COALESCE_MS = 16
+    # Markers are cached at Markers.OVERSAMPLE times their size; zooming in further would blur them
+    MAX_ZOOM = Markers.OVERSAMPLE
+
+    def __init__(self, map_manager: MapManager, data_manager: DataManager, data_table: QTableView):
         super().__init__()
         self.scene = QGraphicsScene(self)
         self.setScene(self.scene)
@@ -25,120 +42,243 @@ class HexMapView(QGraphicsView):
         self.data_table = data_table
         self.markers = Markers()
         self.dragging = False  # Track if we are dragging for panning
-        self.last_mouse_pos = QPointF()  # Last mouse position during dragging
+        self.last_mouse_pos = QPoint()  # Last mouse position during dragging, in view pixels
         self.selected_hex_tile = None  # Initialize selected_hex_tile
-        self.hex_map_tile_to_region = {}  # Mapping from HexTile to region data
         self.coordinates_to_hex_tile = {}  # mapping from (x, y) to HexTile
         self.hex_to_settlement_marker = {}  # mapping from HexTile to settlement marker
         self.show_coords = True  # Boolean flag to track if hex coordinates are shown
+        self.outline_min_lod = OUTLINE_MIN_LOD  # Zoom below which hex outlines are skipped; see set_outline_min_lod
+        self._load_faction_number = None
+        self._view_state_before_load = None  # Render hints and update mode to restore after a load
+        self._column_widths = None  # Units table column widths, measured once and then reused
+        self._tile_bounds = QRectF()  # Scene area covered by the hex tiles, grown as tiles are created
+        # Wheel ticks arriving within one frame are folded into a single scale() call
+        self._pending_zoom = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
         self.init_ui()
-        print(f"HexMapView initialized with data_table: {self.data_table}")
+        logger.debug("HexMapView initialized with data_table: %s", self.data_table)
 
     def init_ui(self):
         # Enable antialiasing for smoother graphics
         self.setRenderHint(QPainter.Antialiasing)
         # Enable zooming functionality
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        # Repaint only the changed areas when few items change, the bounding rect when many do
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+
+    def enable_opengl_viewport(self, samples=4):
+        """
+        Render the map through a multisampled QOpenGLWidget when Qt has OpenGL support.
+
+        Args:
+            samples (int): The number of samples per pixel for antialiasing.
+
+        Returns:
+            bool: True if the OpenGL viewport is in use.
+        """
+        if QOpenGLWidget is None:
+            return False
+
+        viewport = QOpenGLWidget()
+        surface_format = QSurfaceFormat()
+        surface_format.setSamples(samples)
+        viewport.setFormat(surface_format)
+        self.setViewport(viewport)
+
+        # A GL viewport redraws the whole frame anyway, so skip the dirty-region bookkeeping
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # The widget stylesheet background does not reach a GL viewport
+        self.setBackgroundBrush(QColor('#1F1F1F'))
+        return True
 
     def toggle_hex_labels(self):
         """Toggle the visibility of hex coordinate labels."""
         self.show_coords = not self.show_coords  # Flip the flag
-        print(f"Toggling hex labels. New state: {self.show_coords}")  # Debugging
-        for item in self.scene.items():
-            if isinstance(item, HexTile):
-                item.set_show_coords(self.show_coords)  # Update the visibility of labels
+        logger.debug("Toggling hex labels. New state: %s", self.show_coords)
+        self._repaint_tiles()
+
+    def set_outline_min_lod(self, lod):
+        """
+        Set the zoom level below which hex outlines are left out.
+
+        Args:
+            lod (float): Device pixels per scene unit; 0 draws outlines at every zoom.
+        """
+        if lod != self.outline_min_lod:
+            self.outline_min_lod = lod
+            self._repaint_tiles()
+
+    def _repaint_tiles(self):
+        """Refresh every tile's cached image after a view-wide drawing setting changed."""
+        # Only the tiles are affected; walk them directly and repaint once at the end
+        self.setUpdatesEnabled(False)
+        try:
+            for hex_tile in self.coordinates_to_hex_tile.values():
+                # The settings are shared by every tile, so only their cached images need refreshing
+                hex_tile.update()
+        finally:
+            self.setUpdatesEnabled(True)
 
     
 
     def load_map_data(self, regions_data):
+        """Place all regions on the map in one go."""
         try:
-            print("Loading map data...")
-            print(f"Total regions to load: {len(regions_data)}")
+            self.add_regions(self.begin_map_load(regions_data))
+            self.finish_map_load()
+        except Exception as e:
+            self.abort_map_load(e)
+
+    def begin_map_load(self, regions_data):
+        """
+        Prepare the map for a new set of regions.
+
+        Clears the unit markers and the data table and drops regions that
+        cannot be placed. The regions are then handed to add_regions, in one
+        call or in several batches, followed by a single call to
+        finish_map_load.
+
+        Args:
+            regions_data (list): The region dicts to place.
 
-            # Retrieve faction info
-            faction_info = self.data_manager.get_faction_info()
-            faction_number = faction_info.get("number")
+        Returns:
+            list: The valid regions, in their original order.
+        """
+        logger.debug("Loading map data: %d regions", len(regions_data))
 
-            # Clear all existing unit markers and data
-            self.clear_all_unit_markers()
-            self.clear_data_table()
+        # Retrieve faction info
+        faction_info = self.data_manager.get_faction_info()
+        self._load_faction_number = faction_info.get("number")
 
-            # self.update_map_data(regions_data)
+        # Clear all existing unit markers and data
+        self.clear_all_unit_markers()
+        self.clear_data_table()
 
-            # Group regions by x_coord
-            columns = defaultdict(list)
-            for region in regions_data:
-                if not isinstance(region, dict):
-                    print(f"Warning: Invalid region data: {region}")
+        # Skip per-insert BSP tree updates while tiles are added; finish_map_load rebuilds it once
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+
+        # Don't track repaint regions or antialias while tiles are added; restored when the load ends
+        if self._view_state_before_load is None:
+            self._view_state_before_load = (self.renderHints(), self.viewportUpdateMode())
+        self.setRenderHint(QPainter.Antialiasing, False)
+        self.setViewportUpdateMode(QGraphicsView.NoViewportUpdate)
+
+        # Keep regions on valid hex coordinates (non-negative, x and y of equal parity).
+        # Each region is placed independently, so they are not reordered.
+        valid_regions = []
+        for region in regions_data:
+            if not isinstance(region, dict):
+                logger.warning("Invalid region data: %r", region)
+                continue
+            coordinates = region.get('coordinates')
+            if not coordinates:
+                logger.warning("Region without coordinates: %r", region)
+                continue
+            x, y = coordinates.get('x'), coordinates.get('y')
+            if x is None or y is None or x < 0 or y < 0 or (x ^ y) & 1:
+                logger.warning("Invalid coordinates: (%s, %s)", x, y)
+                continue
+            valid_regions.append(region)
+
+        return valid_regions
+
+    def add_regions(self, regions):
+        """
+        Create the hex tiles and markers for a batch of regions.
+
+        Args:
+            regions (list): Part of the list returned by begin_map_load, already validated.
+        """
+        # Hold off repaints and scene notifications until the whole batch is in the scene
+        self.setUpdatesEnabled(False)
+        signals_blocked = self.scene.blockSignals(True)
+        try:
+            self._add_region_batch(regions)
+        finally:
+            self.scene.blockSignals(signals_blocked)
+            self.setUpdatesEnabled(True)
+
+    def _add_region_batch(self, regions):
+        """Place each region of a batch; called by add_regions with updates disabled."""
+        faction_number = self._load_faction_number
+        # Resolve the per-region callables and maps once for the whole batch
+        coord_map = self.coordinates_to_hex_tile
+        create_hex = self.create_and_place_hex
+        apply_markers = self._apply_markers
+        has_faction_units = self._has_faction_units
+        update_data = self.update_hex_data
+        for region in regions:
+            # begin_map_load has already checked the coordinates
+            coordinates = region['coordinates']
+            x, y = coordinates['x'], coordinates['y']
+            terrain = region.get('terrain', 'unknown')
+
+            units = region.get('units', [])
+            if units is None:
+                units = []
+
+            # Create and place hex tile, or take over the one an earlier region's exit placed here
+            hex_tile = create_hex(x, y, terrain)
+            hex_tile.region = region
+
+            # Add or remove all three markers in one call
+            apply_markers(hex_tile, region, has_faction_units(units, faction_number))
+
+            # Place a tile for each neighbour this region's exits lead to that is not on the map yet
+            for exit in region.get('exits') or ():
+                neighbor_region = exit['region']
+                neighbor_coords = neighbor_region['coordinates']
+                neighbor_key = nx, ny = neighbor_coords['x'], neighbor_coords['y']
+                # Most neighbours are already placed, so test that before the coordinates
+                if neighbor_key in coord_map or nx < 0 or ny < 0 or (nx ^ ny) & 1:
                     continue
-                x = region.get('coordinates', {}).get('x')
-                if x is not None:
-                    columns[x].append(region)
-
-            # Process regions
-            for x in sorted(columns.keys()):
-                sorted_regions = sorted(columns[x], key=lambda r: r.get('coordinates', {}).get('y'))
-                print(f"Column {x} sorted y-coordinates: {[r.get('coordinates', {}).get('y') for r in sorted_regions]}")
-                for region in sorted_regions:
-                    coordinates = region.get('coordinates', {})
-                    x, y = coordinates.get('x'), coordinates.get('y')
-                    terrain = region.get('terrain', 'unknown')
-                    structures = region.get('structures')
-                    settlement = region.get('settlement')
-                    print(f"Processing region at ({x}, {y}) with terrain: {terrain}, structures: {structures}, settlement: {settlement}")
-
-                    units = region.get('units', [])
-                    if units is None:
-                        units = []
-                    print(f"Units in region: {len(units)}")
-
-                    # Validate coordinates
-                    if x is None or y is None or not self.is_valid_hex_coordinate(x, y):
-                        print(f"Invalid coordinates: ({x}, {y})")
-                        continue
-
-                    # Create and place hex tile
-                    hex_tile = self.create_and_place_hex(x, y, terrain, units)
-                    self.hex_map_tile_to_region[hex_tile] = region
-                    self.coordinates_to_hex_tile[(x, y)] = hex_tile
-
-                    # Handle unit markers
-                    self.update_unit_marker(hex_tile, units, faction_number)
-
-                    # Update settlement marker
-                    self.update_settlement_marker(hex_tile, settlement)
-
-                    # Handle structure markers
-                    self.update_structure_marker(hex_tile, structures)
-
-                    # Update the persistent map data
-                    self.update_hex_data(x, y, region)
-
-            # Process exits and ensure neighbors are placed
-            self.process_exits(regions_data)
-
-            # Adjust the scene
-            self.setSceneRect(self.scene.itemsBoundingRect())
-            self.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
-            print("Map data loaded successfully.")
-            
-            # Emit a signal when the map data is successfully loaded
-            self.report_loaded.emit("Map data loaded successfully.")
-        except Exception as e:
-            print(f"Error loading map data: {e}")
-            import traceback
-            traceback.print_exc()
-            self.report_loaded.emit("Error loading map data. (see console for details)")
+                neighbor_hex_tile = create_hex(nx, ny, neighbor_region.get('terrain'))
+                neighbor_hex_tile.region = neighbor_region
+
+            # Update the persistent map data once, with the whole region
+            update_data(x, y, region)
+
+    def finish_map_load(self):
+        """Index the scene and fit the view once all regions are added."""
+        # Index the finished map for hit-testing and visible-item lookups
+        self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self._restore_view_after_load()
+
+        # Adjust the scene; the tile bounds are kept up to date as tiles are created
+        self.setSceneRect(self._tile_bounds)
+        self.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
+        logger.debug("Map data loaded: %d hex tiles", len(self.coordinates_to_hex_tile))
+        
+        # Emit a signal when the map data is successfully loaded
+        self.report_loaded.emit("Map data loaded successfully.")
+
+    def abort_map_load(self, error):
+        """Report an error raised while loading map data."""
+        logger.error("Error loading map data: %s", error, exc_info=error)
+        self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self._restore_view_after_load()
+        self.report_loaded.emit("Error loading map data. (see console for details)")
+
+    def _restore_view_after_load(self):
+        """Put back the render hints and viewport update mode begin_map_load switched off, and repaint."""
+        if self._view_state_before_load is not None:
+            render_hints, update_mode = self._view_state_before_load
+            self._view_state_before_load = None
+            self.setRenderHints(render_hints)
+            self.setViewportUpdateMode(update_mode)
+        self.viewport().update()
 
     def clear_all_unit_markers(self):
+        """Hide every unit marker; each tile keeps its marker to show again on the next load."""
         for hex_tile in self.coordinates_to_hex_tile.values():
-            if hex_tile.unit_marker:
-                self.scene.removeItem(hex_tile.unit_marker)
-                hex_tile.unit_marker = None
+            if hex_tile.unit_marker is not None:
+                hex_tile.unit_marker.setVisible(False)
             hex_tile.units = []
 
     def clear_data_table(self):
-        self.data_table.setRowCount(0)
+        self.data_table.model().sourceModel().clear()
 
     def update_hex_data(self, x, y, data):
         self.map_manager.update_region(x, y, data)  # Use map_manager instead of data_manager
@@ -146,166 +286,100 @@ class HexMapView(QGraphicsView):
         if hex_tile:
             hex_tile.update_from_data(data)
 
-    def update_map_data(self, regions_data):
-         # Group regions by x_coord
-            columns = defaultdict(list)
-            for region in regions_data:
-                if not isinstance(region, dict):
-                    print(f"Warning: Invalid region data: {region}")
-                    continue
-                x = region.get('coordinates', {}).get('x')
-                if x is not None:
-                    columns[x].append(region)
-
-            # Process regions
-            for x in sorted(columns.keys()):
-                sorted_regions = sorted(columns[x], key=lambda r: r.get('coordinates', {}).get('y'))
-                print(f"Column {x} sorted y-coordinates: {[r.get('coordinates', {}).get('y') for r in sorted_regions]}")
-                for region in sorted_regions:
-                    coordinates = region.get('coordinates', {})
-                    x, y = coordinates.get('x'), coordinates.get('y')
-                    terrain = region.get('terrain', 'unknown')
-                    structures = region.get('structures')
-                    settlement = region.get('settlement')
-                    print(f"Processing region at ({x}, {y}) with terrain: {terrain}, structures: {structures}, settlement: {settlement}")
-
-                    units = region.get('units', [])
-                    if units is None:
-                        units = []
-                    print(f"Units in region: {len(units)}")
-
-                    # Validate coordinates
-                    if x is None or y is None or not self.is_valid_hex_coordinate(x, y):
-                        print(f"Invalid coordinates: ({x}, {y})")
-                        continue
-
-                    # Create and place hex tile
-                    hex_tile = self.create_and_place_hex(x, y, terrain, units)
-                    self.hex_map_tile_to_region[hex_tile] = region
-                    self.coordinates_to_hex_tile[(x, y)] = hex_tile
-
-                    # Update settlement marker
-                    self.update_settlement_marker(hex_tile, settlement)
-
-                    # Handle structure markers
-                    self.update_structure_marker(hex_tile, structures)
-
-                    # Update the persistent map data
-                    self.update_hex_data(x, y, region)
-
-
-    def process_exits(self, regions_data):
-        for region in regions_data:
-            x = region['coordinates']['x']
-            y = region['coordinates']['y']
-            for exit in region.get('exits', []):
-                neighbor_coords = exit['region']['coordinates']
-                nx, ny = neighbor_coords['x'], neighbor_coords['y']
-                neighbor_coord_key = (nx, ny)
-                if not self.is_valid_hex_coordinate(nx, ny):
-                    continue
-                if neighbor_coord_key not in self.coordinates_to_hex_tile:
-                    neighbor_terrain = exit['region'].get('terrain')
-                    neighbor_hex_tile = self.create_and_place_hex(nx, ny, neighbor_terrain, [])
-                    self.hex_map_tile_to_region[neighbor_hex_tile] = exit['region']
-                    self.coordinates_to_hex_tile[neighbor_coord_key] = neighbor_hex_tile
-
-    def update_unit_marker(self, hex_tile, units, faction_number):
-        has_faction_units = any(
-            unit.get('faction', {}).get('number', 'Hidden') == faction_number
-            for unit in units
-        )
+    @staticmethod
+    def _has_faction_units(units, faction_number):
+        """
+        Check whether any of a hex's units belongs to the player's faction.
+
+        Args:
+            units (list): The unit dicts of the hex.
+            faction_number: The player's faction number.
+
+        Returns:
+            bool: True as soon as one unit of the faction is found.
+        """
+        for unit in units:
+            faction = unit.get('faction')
+            if faction is not None and faction.get('number', 'Hidden') == faction_number:
+                return True
+        return False
+
+    def _apply_markers(self, hex_tile, region, has_faction_units):
+        """
+        Add or remove the unit, settlement and structure markers of a hex in one pass.
 
+        Args:
+            hex_tile: The hex tile object to update.
+            region (dict): The region data for the hex.
+            has_faction_units (bool): Whether any unit in the hex belongs to the player's faction.
+        """
+        scene = self.scene
+        markers = self.markers
+
+        # Unit marker; created once per tile, then shown and hidden as the units come and go
+        unit_marker = hex_tile.unit_marker
         if has_faction_units:
-            if hex_tile.unit_marker is None:
-                triangle = self.markers.create_triangle_marker(color='white', size=8, circle_color='white', circle_size=5)
+            if unit_marker is None:
+                triangle = markers.create_triangle_marker(color='white', size=8, circle_color='white', circle_size=5)
                 triangle.setParentItem(hex_tile)
                 triangle.setPos(0, 20)
                 hex_tile.unit_marker = triangle
-        else:
-            if hex_tile.unit_marker:
-                hex_tile.unit_marker.setParentItem(None)
-                self.scene.removeItem(hex_tile.unit_marker)
-                hex_tile.unit_marker = None
+            else:
+                unit_marker.setVisible(True)
+        elif unit_marker is not None:
+            unit_marker.setVisible(False)
 
-        # Update the persistent map data
-        self.update_hex_data(hex_tile.x_coord, hex_tile.y_coord, {'units': units})
-        
-    def update_settlement_marker(self, hex_tile, settlement):
-        if settlement:
+        # Settlement marker
+        if region.get('settlement'):
             if hex_tile.settlement_marker is None:
-                ring_with_dot = self.markers.create_ring_with_dot_marker(
-                    ring_color='white', 
-                    dot_color='white', 
-                    outer_diameter=12, 
-                    ring_thickness=2, 
-                    dot_diameter=4
+                ring_with_dot = markers.create_ring_with_dot_marker(
+                    ring_color='white', dot_color='white', outer_diameter=12, ring_thickness=2, dot_diameter=4
                 )
                 ring_with_dot.setParentItem(hex_tile)
                 ring_with_dot.setPos(0, -20)
                 hex_tile.settlement_marker = ring_with_dot
-        else:
-            if hex_tile.settlement_marker:
-                hex_tile.settlement_marker.setParentItem(None)
-                self.scene.removeItem(hex_tile.settlement_marker)
-                hex_tile.settlement_marker = None
-
-        # Update the persistent map data
-        self.update_hex_data(hex_tile.x_coord, hex_tile.y_coord, {'settlement': settlement})
-
-    def update_structure_marker(self, hex_tile, structures):
-        """
-        Update the structure marker on the given hex_tile.
-
-        Args:
-            hex_tile: The hex tile object to update.
-            structures: The structure data associated with the hex.
-        """
-        if structures and isinstance(structures, list) and len(structures) > 0:
-            if not hasattr(hex_tile, 'structure_marker') or hex_tile.structure_marker is None:
-                # Create the hollow box marker
-                hollow_box = self.markers.create_hollow_box_marker(
-                    box_color='white',      # Color of the box outline
-                    outer_size=12,         # Size of the box
-                    box_thickness=2        # Thickness of the box outline
-                )
-                # Set the marker as a child of the hex_tile for proper positioning
+        elif hex_tile.settlement_marker is not None:
+            hex_tile.settlement_marker.setParentItem(None)
+            scene.removeItem(hex_tile.settlement_marker)
+            hex_tile.settlement_marker = None
+
+        # Structure marker
+        structures = region.get('structures')
+        if structures and isinstance(structures, list):
+            if hex_tile.structure_marker is None:
+                hollow_box = markers.create_hollow_box_marker(box_color='white', outer_size=12, box_thickness=2)
                 hollow_box.setParentItem(hex_tile)
-                # Position the marker 20px to the right of the hex center
                 hollow_box.setPos(25, 0)
-                # Assign the marker to the hex_tile for future reference
                 hex_tile.structure_marker = hollow_box
-                print(f"Added structure marker to hex ({hex_tile.x_coord}, {hex_tile.y_coord})")
-        else:
-            if hasattr(hex_tile, 'structure_marker') and hex_tile.structure_marker:
-                # Remove the structure marker
-                hex_tile.structure_marker.setParentItem(None)
-                self.scene.removeItem(hex_tile.structure_marker)
-                # Clear the reference
-                hex_tile.structure_marker = None
-                print(f"Removed structure marker from hex ({hex_tile.x_coord}, {hex_tile.y_coord})")
-        
-        # Update the persistent map data with the structure information
-        if structures:
-            self.update_hex_data(hex_tile.x_coord, hex_tile.y_coord, {'structures': structures})
-        else:
-            self.update_hex_data(hex_tile.x_coord, hex_tile.y_coord, {'structure': None})
+        elif hex_tile.structure_marker is not None:
+            hex_tile.structure_marker.setParentItem(None)
+            scene.removeItem(hex_tile.structure_marker)
+            hex_tile.structure_marker = None
+
+    def create_and_place_hex(self, x, y, terrain):
+        """
+        Return the hex tile at (x, y), creating and registering it if the map has none yet.
 
+        Args:
+            x (int): Column of the hex.
+            y (int): Row of the hex.
+            terrain (str): Terrain for a newly created tile; an existing tile keeps its own.
 
-    def create_and_place_hex(self, x, y, terrain, regions_data):
-        hex_tile = HexTile(x, y, terrain, self, [])
-        self.scene.addItem(hex_tile)
-        print(f"Neighbor HexTile created at ({x}, {y}) with terrain: {terrain}")
+        Returns:
+            HexTile: The tile at (x, y).
+        """
+        hex_tile = self.coordinates_to_hex_tile.get((x, y))
+        if hex_tile is None:
+            hex_tile = HexTile(x, y, terrain, self, [])
+            self.scene.addItem(hex_tile)
+            self.coordinates_to_hex_tile[(x, y)] = hex_tile
+            self._tile_bounds = self._tile_bounds.united(hex_tile.sceneBoundingRect())
         return hex_tile
 
-    def is_valid_hex_coordinate(self, x, y):
-        # Define valid coordinate rules based on your map's design
-        if x < 0 or y < 0:
-            return False
-        if x % 2 == 0:
-            return y % 2 == 0
-        else:
-            return y % 2 == 1
+    @staticmethod
+    def is_valid_hex_coordinate(x, y):
+        # Valid hexes have non-negative coordinates of equal parity; (x ^ y) & 1 is 0 exactly when the parities match
+        return x >= 0 and y >= 0 and not (x ^ y) & 1
 
     def mousePressEvent(self, event):
         if event.button() == Qt.RightButton:
@@ -316,26 +390,48 @@ class HexMapView(QGraphicsView):
         elif event.button() == Qt.LeftButton:
             # Handle left-click events (hex selection)
             scene_pos = self.mapToScene(event.pos())
-            items = self.scene.items(scene_pos)
-            for item in items:
-                if isinstance(item, HexTile):
-                    self.highlight_hex_tile(item)
-                    self.update_data_table(item)
-                    # Emit the full region data when a hex is selected
-                    region = self.hex_map_tile_to_region.get(item)
-                    if region:
-                       
-                        self.hex_selected.emit(region)
-                    break
+            hex_tile = self.coordinates_to_hex_tile.get(self._scene_to_hex(scene_pos))
+            if hex_tile is None:
+                # Fall back to the topmost item for anything the grid math does not cover;
+                # markers are children of their tile, so walk up to it
+                item = self.scene.itemAt(scene_pos, self.viewportTransform())
+                while item is not None and not isinstance(item, HexTile):
+                    item = item.parentItem()
+                hex_tile = item
+            if hex_tile is not None:
+                self.highlight_hex_tile(hex_tile)
+                self.update_data_table(hex_tile)
+                # Emit the full region data when a hex is selected
+                region = hex_tile.region
+                if region:
+                    self.hex_selected.emit(region)
             super().mousePressEvent(event)
 
+    def _scene_to_hex(self, scene_pos):
+        """
+        Return the map coordinates of the hex containing a scene position.
+
+        Args:
+            scene_pos (QPointF): A position in scene coordinates.
+
+        Returns:
+            tuple: The (x, y) coordinates of the hex under the position.
+        """
+        return scene_to_hex(scene_pos.x(), scene_pos.y())
+
     def mouseMoveEvent(self, event):
         if self.dragging:
             # Right-click dragging for panning
-            delta = event.pos() - self.last_mouse_pos
-            self.last_mouse_pos = event.pos()
-            self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - delta.x())
-            self.verticalScrollBar().setValue(self.verticalScrollBar().value() - delta.y())
+            pos = event.pos()
+            delta = pos - self.last_mouse_pos
+            self.last_mouse_pos = pos
+            # Scroll by the integer pixel delta; skip a scrollbar that did not move
+            if delta.x():
+                h_bar = self.horizontalScrollBar()
+                h_bar.setValue(h_bar.value() - delta.x())
+            if delta.y():
+                v_bar = self.verticalScrollBar()
+                v_bar.setValue(v_bar.value() - delta.y())
             event.accept()
         else:
             super().mouseMoveEvent(event)
@@ -349,14 +445,30 @@ class HexMapView(QGraphicsView):
             super().mouseReleaseEvent(event)
 
     def wheelEvent(self, event):
-        zoom_in_factor = 1.15
-        zoom_out_factor = 1 / zoom_in_factor
-
         if event.angleDelta().y() > 0:
-            zoom_factor = zoom_in_factor
+            zoom_factor = self.ZOOM_IN_FACTOR
         else:
-            zoom_factor = zoom_out_factor
-
+            zoom_factor = self.ZOOM_OUT_FACTOR
+
+        # Apply the first tick at once; ticks arriving within the next frame are collected and
+        # applied together when the timer fires, so continuous scrolling zooms at most once per frame
+        self._pending_zoom *= zoom_factor
+        if not self._zoom_timer.isActive():
+            self._apply_zoom()
+            self._zoom_timer.start(self.ZOOM_COALESCE_MS)
+        event.accept()
+
+    def _apply_zoom(self):
+        """Apply the zoom collected by wheelEvent in one scale() call."""
+        zoom_factor = self._pending_zoom
+        if zoom_factor == 1.0:
+            return
+        self._pending_zoom = 1.0
+        # Stop zooming in at MAX_ZOOM; zooming out is never limited
+        if zoom_factor > 1:
+            zoom_factor = min(zoom_factor, self.MAX_ZOOM / self.transform().m11())
+            if zoom_factor <= 1:
+                return
         self.scale(zoom_factor, zoom_factor)
 
     def highlight_hex_tile(self, hex_tile):
@@ -374,167 +486,61 @@ class HexMapView(QGraphicsView):
         Args:
             hex_tile: The selected hex tile object.
         """
-        print(f"Updating data table with units: {hex_tile.units}")
-        self.data_table.setRowCount(0)
-        self.data_table.setColumnCount(0)
+        # Fill the model with sorting and repaints suspended so it is sorted once
+        with batched_update(self.data_table):
+            self._fill_data_table(hex_tile)
+
+    def _fill_data_table(self, hex_tile):
+        """Build the rows for update_data_table; called inside batched_update."""
+        logger.debug("Updating data table for hex (%s, %s)", hex_tile.x_coord, hex_tile.y_coord)
+        model = self.data_table.model().sourceModel()  # Rows go to the model behind the sort proxy
+
+        # The model reset below resets the column widths; note the current ones, including any the user dragged
+        if self._column_widths is not None and model.rowCount():
+            self._column_widths = [self.data_table.columnWidth(column) for column in range(model.columnCount())]
 
         # Retrieve region data associated with the hex_tile
-        region = self.hex_map_tile_to_region.get(hex_tile)
+        region = hex_tile.region
         if not region:
-            print(f"No region data found for hex_tile: {hex_tile}")
+            logger.debug("No region data found for hex (%s, %s)", hex_tile.x_coord, hex_tile.y_coord)
+            model.clear()
             return
 
         structures = region.get('structures', [])
-        print(f"Structures: {structures}")
 
         # Check if there are units or structures to display
         if not hex_tile.units and not structures:
-            print("No units or structures to display.")
+            model.clear()
             return
-        
-        # Define the columns you want to display
-        columns = [
-            "Structure",
-            "Unit Name",
-            "Faction Name",
-            "Status",
-            "Avoid",
-            "Guard",
-            "Contains",
-            "Skills"
-        ]
 
-        # Set table headers
-        self.data_table.setColumnCount(len(columns))
-        self.data_table.setHorizontalHeaderLabels(columns)
-
-        # Calculate total rows needed
-        structure_unit_count = sum(len(structure.get('units', [])) for structure in structures)
-        total_rows = len(hex_tile.units) + structure_unit_count
-        self.data_table.setRowCount(total_rows)
-
-        # Initialize row index
-        row_index = 0
-
-        # Process structures and their units
-        for structure in structures:
-            structure_name = f"{structure.get('name', 'Unknown')} ({structure.get('number', 'N/A')})"
-            structure_units = structure.get('units', [])
-            
-            for unit in structure_units:
-                self.add_unit_to_table(row_index, unit, structure_name)
-                row_index += 1
-
-        # Process units directly in the hex_tile (not part of any structure)
-        for unit in hex_tile.units:
-            self.add_unit_to_table(row_index, unit, structure_name=None)  # No structure associated
-            row_index += 1
-
-        # Adjust the table for better readability
-        self.data_table.resizeColumnsToContents()
-        self.data_table.horizontalHeader().setStretchLastSection(True)
-        self.data_table.setSortingEnabled(True)
-        self.data_table.setEditTriggers(QTableWidget.NoEditTriggers)  # Make the table read-only
-        self.data_table.setSelectionBehavior(QTableWidget.SelectRows)  # Make the table read-only
-        
-        # Optionally, set alignment for all cells
-        for row in range(self.data_table.rowCount()):
-            for col in range(self.data_table.columnCount()):
-                item = self.data_table.item(row, col)
-                if item:
-                    item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)  # Align left and vertically center
-
-    def add_unit_to_table(self, row, unit, structure_name=None):
-        """
-        Add a unit to the data table at the specified row.
-        
-        Args:
-            row (int): The row index in the table.
-            unit (dict): The unit data.
-            structure_name (str, optional): The name of the structure the unit belongs to. Defaults to None.
-        """
-        # Structure Display
-        structure_display = structure_name if structure_name else "None"
-
-        # Unit Name and Number
-        unit_name = unit.get('name', 'Unknown')
-        unit_number = unit.get('number', 'N/A')
-        role_display = f"{unit_name} ({unit_number})"
-
-        # Faction Information
-        faction = unit.get('faction', {})
-        faction_info = faction.get('name', 'Unknown Faction')
-        faction_number = faction.get('number', 'Hidden')
-        faction_display = f"{faction_info} (#{faction_number})" if faction_number else faction_info
-
-        # Status (from 'attitude')
-        status = f" {unit.get('attitude', 'neutral')} "
-
-        # Flags (from 'flags')
-        flags = unit.get('flags', {})
-        avoid = flags.get('avoid', False)
-        guard = flags.get('guard', False)
-        avoid_display = "Yes" if avoid else "No"
-        guard_display = "Yes" if guard else "No"
-
-        # Units Details (from 'items' or 'units')
-        units_details = unit.get('units') or unit.get('items') or []
-        if isinstance(units_details, list):
-            # Convert list of dictionaries to a readable string
-            units_display = " ; ".join([
-                f"{item.get('amount', '')}x {item.get('name', '')}" for item in units_details
-            ])
-            # Create a detailed tooltip
-            detailed_units = "\n".join([
-                f"{item.get('amount', '')}x {item.get('name', '')} ({item.get('tag', '')})" for item in units_details
-            ])
-        elif isinstance(units_details, dict):
-            units_display = f"Avoid: {avoid_display}, Guard: {guard_display}"
-            detailed_units = units_display
-        else:
-            units_display = str(units_details)
-            detailed_units = units_display
-
-        # Skills Extraction and Formatting
-        skills = unit.get('skills', {})
-        known_skills = skills.get('known', [])
-        if known_skills:
-            # Format: "Skill Name (Level X), Skill Name (Level Y)"
-            skills_display = ", ".join([
-                f"{skill.get('name', 'Unknown Skill')} (Level {skill.get('level', 'N/A')})" for skill in known_skills
-            ])
-            # Create a detailed tooltip for skills
-            detailed_skills = "\n".join([
-                f"{skill.get('name', 'Unknown Skill')}: Level {skill.get('level', 'N/A')}, Days: {skill.get('skill_days', 'N/A')}, Tag: {skill.get('tag', 'N/A')}" for skill in known_skills
-            ])
-        else:
-            skills_display = "None"
-            detailed_skills = "No known skills."
-
-        # Compile Table Data
-        table_data = [
-            structure_display,
-            role_display,
-            faction_display,
-            status,
-            avoid_display,
-            guard_display,
-            units_display,  
-            skills_display
+        # Pair each unit with the structure it is in, naming each structure once; the model formats the rows
+        named_structures = (
+            (f"{structure.get('name', 'Unknown')} ({structure.get('number', 'N/A')})", structure.get('units', []))
+            for structure in structures
+        )
+        units = [
+            (unit, structure_name)
+            for structure_name, structure_units in named_structures
+            for unit in structure_units
         ]
-
-        for col, data in enumerate(table_data):
-            item = QTableWidgetItem(data)
-            if col == 6:  # 'Contains' column
-                item.setToolTip(detailed_units)
-            if col == 7:  # 'Skills' column
-                item.setToolTip(detailed_skills)
-            self.data_table.setItem(row, col, item)
-            print(f"Set row {row}, column {col} to {data}")
+        # Units directly in the hex_tile have no structure
+        units.extend((unit, None) for unit in hex_tile.units)
+
+        model.set_units(units)
+
+        # Size the columns to their contents the first time there are rows, then reuse those widths;
+        # the header settings were made once in MainWindow.init_ui
+        if model.rowCount():
+            widths = self._column_widths
+            if widths is None or len(widths) != model.columnCount():
+                self.data_table.resizeColumnsToContents()
+                self._column_widths = [self.data_table.columnWidth(column) for column in range(model.columnCount())]
+            else:
+                for column, width in enumerate(widths):
+                    self.data_table.setColumnWidth(column, width)
 
     def refresh_map(self):
-        self.clear_all_unit_markers()
-        self.clear_data_table()
-        self.load_map_data(self.map_manager.get_map_data())
+        """Reload the map from the MapManager; begin_map_load clears the markers and data table."""
+        self.load_map_data(list(self.map_manager.get_map_data().values()))
 
 
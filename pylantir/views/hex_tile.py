@@ -1,9 +1,97 @@
 from PySide6.QtWidgets import QGraphicsItem
-from PySide6.QtGui import QPainter, QPainterPath, QColor, QPen, QFont
+from PySide6.QtGui import QPainter, QPainterPath, QColor, QPen, QFont, QBrush, QPolygonF, QStaticText, QTransform
 from PySide6.QtCore import QRectF, QPointF, Qt
 import math
 
+# Distance from a hex's center to its corners, in scene units
+HEX_SIZE = 40
+
+# Distance between the centers of neighbouring columns, and between rows (y steps by 2 within a column)
+HEX_COLUMN_SPACING = HEX_SIZE * 3 / 2
+HEX_ROW_SPACING = math.sqrt(3) * HEX_SIZE / 2
+
+# Corners of a flat-top hexagon of radius 1, at 0, 60, ..., 300 degrees
+_S32 = math.sqrt(3) / 2
+_HEX_UNIT = ((1.0, 0.0), (0.5, _S32), (-0.5, _S32), (-1.0, 0.0), (-0.5, -_S32), (0.5, -_S32))
+
+# The flat-top hexagon every tile draws, centered on the tile's origin
+HEX_POLYGON = QPolygonF([QPointF(HEX_SIZE * ux, HEX_SIZE * uy) for ux, uy in _HEX_UNIT])
+
+# Fill for each terrain type; terrains not listed use DEFAULT_TERRAIN_BRUSH
+TERRAIN_BRUSHES = {
+    'plain': QBrush(QColor('forestgreen')),
+    'forest': QBrush(QColor('darkgreen')),
+    'mountain': QBrush(QColor('gray')),
+    'swamp': QBrush(QColor('darkolivegreen')),
+    'jungle': QBrush(QColor('olivedrab')),
+    'desert': QBrush(QColor('sandybrown')),
+    'tundra': QBrush(QColor('lightblue')),
+    'nexus': QBrush(QColor('purple')),
+    'ocean': QBrush(QColor('blue')),
+    # Add other terrains as needed
+}
+DEFAULT_TERRAIN_BRUSH = QBrush(QColor('white'))
+
+# Pens shared by every tile's paint
+OUTLINE_PEN = QPen(QColor('black'))
+HIGHLIGHT_PEN = QPen(QColor('darkred'), 2)
+OCEAN_LABEL_PEN = QPen(QColor('#B0B0B0'))  # Light text for ocean terrain
+LABEL_PEN = QPen(QColor('black'))  # Default text color
+NO_PEN = QPen(Qt.NoPen)
+
+# The tile's bounds in item coordinates: the hexagon's full width by its flat-to-flat height, padded
+# by half the widest pen so DeviceCoordinateCache does not clip the outer half of the strokes
+_PEN_MARGIN = max(OUTLINE_PEN.widthF(), HIGHLIGHT_PEN.widthF()) / 2
+HEX_BOUNDING_RECT = QRectF(
+    -HEX_SIZE, -math.sqrt(3) * HEX_SIZE / 2, 2 * HEX_SIZE, math.sqrt(3) * HEX_SIZE
+).adjusted(-_PEN_MARGIN, -_PEN_MARGIN, _PEN_MARGIN, _PEN_MARGIN)
+
+# Hit-testing uses the hexagon itself, so the padding above never makes neighbouring tiles overlap
+HEX_SHAPE = QPainterPath()
+HEX_SHAPE.addPolygon(HEX_POLYGON)
+HEX_SHAPE.closeSubpath()
+
+# Default level of detail (device pixels per scene unit) below which hex outlines are skipped;
+# HexMapView.set_outline_min_lod changes it for the map, 0 always draws them
+OUTLINE_MIN_LOD = 0.3
+
+
+def scene_to_hex(x, y):
+    """
+    Return the map coordinates of the hex containing a scene position.
+
+    Inverts HexTile.calculate_position: the flat-top hexes are placed
+    at (1.5 * size * x, sqrt(3) / 2 * size * y) with x and y of equal
+    parity, which is the doubled-row form of axial coordinates. The
+    point is converted to fractional axial coordinates, rounded to the
+    nearest hex, and converted back.
+
+    Args:
+        x (float): The scene x coordinate.
+        y (float): The scene y coordinate.
+
+    Returns:
+        tuple: The (x, y) coordinates of the hex under the position.
+    """
+    q = (2 / 3 * x) / HEX_SIZE
+    r = (-1 / 3 * x + math.sqrt(3) / 3 * y) / HEX_SIZE
+    s = -q - r
+
+    # Round in cube coordinates, fixing up the component with the largest rounding error
+    rq, rr, rs = round(q), round(r), round(s)
+    dq, dr, ds = abs(rq - q), abs(rr - r), abs(rs - s)
+    if dq > dr and dq > ds:
+        rq = -rr - rs
+    elif dr > ds:
+        rr = -rq - rs
+
+    return rq, 2 * rr + rq
+
+
 class HexTile(QGraphicsItem):
+    # Font for the coordinate labels; a QFont needs a QGuiApplication, so it is created on first paint
+    _label_font = None
+
     def __init__(self, x_coord, y_coord, terrain_type, hex_map_view, units=None):
         super().__init__()
         self.x_coord = x_coord  # Column (q)
@@ -11,95 +99,78 @@ class HexTile(QGraphicsItem):
         self.terrain_type = terrain_type
         self.hex_map_view = hex_map_view  # Reference to the HexMapView
         self.units = units if units is not None else []  # List of units in this hex
-        self.size = 40  # Adjust size as needed
+        self.region = None  # Region data shown when the hex is selected
+        self.settlement = None  # Settlement data; shown by settlement_marker
+        self.structure = None  # Structure data; shown by structure_marker
+        # The coordinate label never changes, so its text layout is kept and reused
+        self._label = QStaticText(f"({x_coord},{y_coord})")
+        self._label.setTextFormat(Qt.PlainText)
+        self._label_offset = None  # Top-left that centers the label; set when it is first laid out
+        self.size = HEX_SIZE
         self.highlighted = False  # Track whether the hex tile is highlighted
         self.setPos(self.calculate_position())
+        # Paint once into a device-resolution pixmap and blit it while panning; update() invalidates it
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
-        # Initialize markers as None
+        # Marker items placed by HexMapView; None until the hex first needs one
         self.unit_marker = None
         self.settlement_marker = None
         self.structure_marker = None
 
     def calculate_position(self):
-        size = self.size
-        width = size * 3 / 2  # Horizontal distance between hex centers
-        height = (math.sqrt(3) * size) / 2  # Vertical distance between hex centers
+        width = HEX_COLUMN_SPACING  # Horizontal distance between hex centers
+        height = HEX_ROW_SPACING  # Vertical distance between hex centers
 
         x = width * self.x_coord
-        # Apply vertical offset for odd columns to stagger the hexes
-        if self.x_coord % 2 != 0:
-            y = height * (self.y_coord)
-        else:
-            y = height * self.y_coord
+        # Odd columns only hold odd y values, so y itself already staggers them
+        y = height * self.y_coord
 
         return QPointF(x, y)
 
     def boundingRect(self):
-        size = self.size
-        width = size * 2
-        height = math.sqrt(3) * size
-        return QRectF(-width / 2, -height / 2, width, height)
+        # Every tile has the same size, so the rect is computed once at import
+        return HEX_BOUNDING_RECT
+
+    def shape(self):
+        return HEX_SHAPE
 
     def paint(self, painter, option, widget):
-        # Draw hexagon
-        path = QPainterPath()
-        for i in range(6):
-            angle_deg = 60 * i  # Flat-top hex
-            angle_rad = math.pi / 180 * angle_deg
-            x = self.size * math.cos(angle_rad)
-            y = self.size * math.sin(angle_rad)
-            if i == 0:
-                path.moveTo(x, y)
-            else:
-                path.lineTo(x, y)
-        path.closeSubpath()
-
-        # Set color based on terrain
-        terrain_colors = {
-            'plain': QColor('forestgreen'),
-            'forest': QColor('darkgreen'),
-            'mountain': QColor('gray'),
-            'swamp': QColor('darkolivegreen'),
-            'jungle': QColor('olivedrab'),
-            'desert': QColor('sandybrown'),
-            'tundra': QColor('lightblue'),
-            'nexus': QColor('purple'),
-            'ocean': QColor('blue'),
-            # Add other terrains as needed
-        }
-        color = terrain_colors.get(self.terrain_type, QColor('white'))
-
-        painter.setBrush(color)
-        painter.setPen(QPen(QColor('black')))
-        painter.drawPath(path)
+        # When zoomed far out, outlines are too small to see; draw just the fill
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+
+        # Draw hexagon, filled according to terrain
+        painter.setBrush(TERRAIN_BRUSHES.get(self.terrain_type, DEFAULT_TERRAIN_BRUSH))
+        if lod >= self.hex_map_view.outline_min_lod:
+            painter.setPen(OUTLINE_PEN)
+        else:
+            # Without outlines, antialiased fills only leave faint seams between neighbouring hexes
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            painter.setPen(NO_PEN)
+        painter.drawPolygon(HEX_POLYGON)
 
         # Draw highlight border if highlighted
         if self.highlighted:
-            painter.setPen(QPen(QColor('darkred'), 2))
-            painter.drawPath(path)
+            painter.setPen(HIGHLIGHT_PEN)
+            painter.drawPolygon(HEX_POLYGON)
 
-
-        # Set text color based on terrain type
-        if self.terrain_type == 'ocean':
-            text_color = QColor('#B0B0B0')  # White text for ocean terrain
-        else:
-            text_color = QColor('black')  # Default text color
-
-        # Draw coordinate labels only if label_visible is True
+        # Draw coordinate labels whenever they are switched on, at any zoom
         if self.hex_map_view.show_coords:
-            painter.setPen(QPen(QColor(text_color)))
-            painter.setFont(QFont('Arial', 8))
-            painter.drawText(self.boundingRect(), Qt.AlignCenter, f"({self.x_coord},{self.y_coord})")
+            # Set text color based on terrain type
+            painter.setPen(OCEAN_LABEL_PEN if self.terrain_type == 'ocean' else LABEL_PEN)
+            if HexTile._label_font is None:
+                HexTile._label_font = QFont('Arial', 8)
+            painter.setFont(HexTile._label_font)
+            if self._label_offset is None:
+                self._label.prepare(QTransform(), HexTile._label_font)
+                label_size = self._label.size()
+                self._label_offset = QPointF(-label_size.width() / 2, -label_size.height() / 2)
+            painter.drawStaticText(self._label_offset, self._label)
 
     def set_highlight(self, highlight):
-        self.highlighted = highlight
-        self.update()  # Trigger a repaint to show/hide the highlight
+        if self.highlighted != highlight:
+            self.highlighted = highlight
+            self.update()  # Trigger a repaint to show/hide the highlight
     
-    def set_show_coords(self, show):
-        """Toggle the display of hex coordinates."""
-        self.hex_map_view.show_coords = show
-        self.update()  # Trigger a repaint to update the coordinate label visibility
-
     def set_terrain(self, terrain_type):
         """Update the terrain type and repaint."""
         if self.terrain_type != terrain_type:
@@ -107,22 +178,16 @@ class HexTile(QGraphicsItem):
             self.update()
 
     def set_structure(self, structure):
-        """Update the structure and repaint."""
-        if self.structure_marker != structure:
-            self.structure_marker = structure
-            self.update()
+        """Update the structure. It is shown by the view's structure marker, so the tile needs no repaint."""
+        self.structure = structure
 
     def set_settlement(self, settlement):
-        """Update the settlement and repaint."""
-        if self.settlement_marker != settlement:
-            self.settlement_marker = settlement
-            self.update()
+        """Update the settlement. It is shown by the view's settlement marker, so the tile needs no repaint."""
+        self.settlement = settlement
 
     def set_units(self, units):
-        """Update the units and repaint."""
-        if self.units != units:
-            self.units = units
-            self.update()
+        """Update the units. Units are shown by the view's markers, so the tile needs no repaint."""
+        self.units = units
 
     def update_from_data(self, data):
         if 'terrain' in data:
@@ -134,4 +199,3 @@ class HexTile(QGraphicsItem):
         if 'settlement' in data:
             self.set_settlement(data['settlement'])
         # Add more updates as needed
-        self.update()
@@ -0,0 +1,49 @@
+import math
+import unittest
+
+from pylantir.views.hex_tile import HEX_COLUMN_SPACING, HEX_ROW_SPACING, scene_to_hex
+
+# Distance from a hex's center to the middle of its edges
+INNER_RADIUS = HEX_ROW_SPACING
+
+
+def hex_center(x, y):
+    """The scene position HexTile.calculate_position gives the hex at (x, y)."""
+    return HEX_COLUMN_SPACING * x, HEX_ROW_SPACING * y
+
+
+def valid_hexes(columns=8, rows=12):
+    return [(x, y) for x in range(columns) for y in range(rows) if not (x ^ y) & 1]
+
+
+class SceneToHexTest(unittest.TestCase):
+    def test_center_maps_to_its_hex(self):
+        for x, y in valid_hexes():
+            with self.subTest(hex=(x, y)):
+                self.assertEqual(scene_to_hex(*hex_center(x, y)), (x, y))
+
+    def test_points_inside_hex_map_to_it(self):
+        for x, y in valid_hexes():
+            cx, cy = hex_center(x, y)
+            for step in range(12):
+                angle = math.radians(30 * step)
+                px = cx + 0.95 * INNER_RADIUS * math.cos(angle)
+                py = cy + 0.95 * INNER_RADIUS * math.sin(angle)
+                with self.subTest(hex=(x, y), angle=30 * step):
+                    self.assertEqual(scene_to_hex(px, py), (x, y))
+
+    def test_point_past_an_edge_maps_to_the_neighbour(self):
+        cx, cy = hex_center(2, 4)
+        self.assertEqual(scene_to_hex(cx, cy + INNER_RADIUS + 1), (2, 6))
+        self.assertEqual(scene_to_hex(cx, cy - INNER_RADIUS - 1), (2, 2))
+
+    def test_result_has_matching_parity(self):
+        for px in range(-50, 400, 7):
+            for py in range(-50, 400, 11):
+                x, y = scene_to_hex(px, py)
+                with self.subTest(point=(px, py)):
+                    self.assertEqual((x ^ y) & 1, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
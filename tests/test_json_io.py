@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pylantir.data import json_io
+
+
+class WriteJsonTest(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self._dir.name, 'data.json')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_round_trip(self):
+        data = {'map': [{'coordinates': {'x': 1, 'y': 3}}], 'report': {'name': 'Ardon'}}
+        json_io.write_json(self.filename, data)
+        self.assertEqual(json_io.read_json(self.filename), data)
+
+    def test_replaces_existing_file_and_leaves_no_temp_file(self):
+        json_io.write_json(self.filename, {'turn': 1})
+        json_io.write_json(self.filename, {'turn': 2})
+        self.assertEqual(json_io.read_json(self.filename), {'turn': 2})
+        self.assertEqual(os.listdir(self._dir.name), ['data.json'])
+
+    def test_failed_replace_keeps_original_and_removes_temp_file(self):
+        json_io.write_json(self.filename, {'turn': 1})
+        with mock.patch.object(json_io.os, 'replace', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                json_io.write_json(self.filename, {'turn': 2})
+        self.assertEqual(json_io.read_json(self.filename), {'turn': 1})
+        self.assertEqual(os.listdir(self._dir.name), ['data.json'])
+
+    def test_unserializable_data_leaves_file_untouched(self):
+        json_io.write_json(self.filename, {'turn': 1})
+        with self.assertRaises(TypeError):
+            json_io.write_json(self.filename, {'turn': object()})
+        self.assertEqual(json_io.read_json(self.filename), {'turn': 1})
+
+
+class EncodingBackendTest(unittest.TestCase):
+    DATA = {'regions': [{'terrain': 'plain', 'units': []}]}
+
+    def test_stdlib_fallback_uses_four_space_indent(self):
+        with mock.patch.object(json_io, 'orjson', None):
+            encoded = json_io.encode_json(self.DATA)
+        self.assertEqual(encoded, json.dumps(self.DATA, indent=4).encode('utf-8'))
+
+    def test_stdlib_fallback_reads_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'data.json')
+            with open(filename, 'wb') as f:
+                f.write(json.dumps(self.DATA).encode('utf-8'))
+            with mock.patch.object(json_io, 'orjson', None):
+                self.assertEqual(json_io.read_json(filename), self.DATA)
+
+    def test_stdlib_fallback_raises_json_decode_error(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'broken.json')
+            with open(filename, 'wb') as f:
+                f.write(b'{"regions": [')
+            with mock.patch.object(json_io, 'orjson', None):
+                with self.assertRaises(json.JSONDecodeError):
+                    json_io.read_json(filename)
+
+    @unittest.skipIf(json_io.orjson is None, "orjson is not installed")
+    def test_orjson_output_reads_back_with_stdlib(self):
+        encoded = json_io.encode_json(self.DATA)
+        self.assertEqual(json.loads(encoded), self.DATA)
+
+    @unittest.skipIf(json_io.orjson is None, "orjson is not installed")
+    def test_orjson_decode_error_is_a_json_decode_error(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'broken.json')
+            with open(filename, 'wb') as f:
+                f.write(b'{"regions": [')
+            with self.assertRaises(json.JSONDecodeError):
+                json_io.read_json(filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import unittest
+
+# Widgets need a QApplication; run it without a display
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication, QTableWidget
+
+from pylantir.ui.table_utils import fill_table
+
+
+class FillTableTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.table = QTableWidget(0, 3)
+
+    def texts(self):
+        return [
+            tuple(self.table.item(row, col).text() for col in range(self.table.columnCount()))
+            for row in range(self.table.rowCount())
+        ]
+
+    def test_fills_rows(self):
+        rows = [("a", "b", "c"), ("d", "e", "f")]
+        fill_table(self.table, rows)
+        self.assertEqual(self.texts(), rows)
+
+    def test_reuses_existing_items(self):
+        fill_table(self.table, [("a", "b", "c"), ("d", "e", "f")])
+        first = self.table.item(0, 0)
+        fill_table(self.table, [("x", "y", "z"), ("u", "v", "w"), ("r", "s", "t")])
+        self.assertIs(self.table.item(0, 0), first)
+        self.assertEqual(self.texts(), [("x", "y", "z"), ("u", "v", "w"), ("r", "s", "t")])
+
+    def test_drops_surplus_rows(self):
+        fill_table(self.table, [("a", "b", "c"), ("d", "e", "f")])
+        fill_table(self.table, [("x", "y", "z")])
+        self.assertEqual(self.texts(), [("x", "y", "z")])
+
+    def test_clears_spans(self):
+        fill_table(self.table, [("No events to display.", "", "")])
+        self.table.setSpan(0, 0, 1, 3)
+        fill_table(self.table, [("a", "b", "c")])
+        self.assertEqual(self.table.columnSpan(0, 0), 1)
+
+    def test_restores_sorting(self):
+        self.table.setSortingEnabled(True)
+        fill_table(self.table, [("b", "", ""), ("a", "", "")])
+        self.assertTrue(self.table.isSortingEnabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
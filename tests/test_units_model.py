@@ -0,0 +1,55 @@
+import unittest
+
+from pylantir.models.units_model import format_unit_row
+
+CONTAINS_COLUMN = 6
+SKILLS_COLUMN = 7
+
+
+def unit(**fields):
+    data = {
+        'name': 'Scouts',
+        'number': 42,
+        'faction': {'name': 'Ardon', 'number': 3},
+        'attitude': 'friendly',
+        'flags': {'guard': True},
+    }
+    data.update(fields)
+    return data
+
+
+class FormatUnitRowTest(unittest.TestCase):
+    def test_cells(self):
+        row, _ = format_unit_row(unit(), "Tower (1)")
+        self.assertEqual(row[:6], ("Tower (1)", "Scouts (42)", "Ardon (#3)", " friendly ", "No", "Yes"))
+
+    def test_item_list_gets_detailed_tooltip(self):
+        items = [{'amount': 2, 'name': 'horse', 'tag': 'HORS'}, {'amount': 1, 'name': 'sword', 'tag': 'SWOR'}]
+        row, tooltips = format_unit_row(unit(items=items))
+        self.assertEqual(row[CONTAINS_COLUMN], "2x horse ; 1x sword")
+        self.assertEqual(tooltips[CONTAINS_COLUMN], "2x horse (HORS)\n1x sword (SWOR)")
+
+    def test_tooltip_left_out_when_it_repeats_the_cell(self):
+        row, tooltips = format_unit_row(unit(items={'horse': 2}))
+        self.assertEqual(row[CONTAINS_COLUMN], "Avoid: No, Guard: Yes")
+        self.assertNotIn(CONTAINS_COLUMN, tooltips)
+
+    def test_empty_item_list_has_no_tooltip(self):
+        row, tooltips = format_unit_row(unit(items=[]))
+        self.assertEqual(row[CONTAINS_COLUMN], "")
+        self.assertNotIn(CONTAINS_COLUMN, tooltips)
+
+    def test_skills_tooltip(self):
+        skills = {'known': [{'name': 'Combat', 'level': 2, 'skill_days': 90, 'tag': 'COMB'}]}
+        row, tooltips = format_unit_row(unit(skills=skills))
+        self.assertEqual(row[SKILLS_COLUMN], "Combat (Level 2)")
+        self.assertEqual(tooltips[SKILLS_COLUMN], "Combat: Level 2, Days: 90, Tag: COMB")
+
+    def test_no_skills_tooltip_explains_the_empty_cell(self):
+        row, tooltips = format_unit_row(unit())
+        self.assertEqual(row[SKILLS_COLUMN], "None")
+        self.assertEqual(tooltips[SKILLS_COLUMN], "No known skills.")
+
+
+if __name__ == '__main__':
+    unittest.main()